@@ -4,22 +4,25 @@ Application coordinator orchestrating notification presentation.
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import os
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Deque, Optional
+from typing import Optional
 
 from PySide6.QtCore import QObject, QTimer, QUrl
 from PySide6.QtGui import QAction, QDesktopServices
 from PySide6.QtWidgets import QApplication, QMenu, QMessageBox, QSystemTrayIcon, QStyle
 
+from core.fs_utils import safe_delete_folder
 from core.idle_monitor import IdleMonitor
 from core.module_loader import DEFAULT_SCAN_INTERVAL_SECONDS, LoadResult, scan_modules
-from core.notification_popup import NotificationPopup
+from core.notification_popup import get_notification_popup
 from core.registry_store import RegistryStore
-from core.settings import CoreSettings, CoreSettingsManager
+from core.registry_watcher import RegistryWatcher
+from core.settings import SETTINGS_SUBKEY, CoreSettings, CoreSettingsManager
 from shared.module_definition import ModuleDefinition
 from windows_notifier_core.windows_notifier_core import logger as app_logger
 
@@ -28,6 +31,9 @@ APP_VERSION = "1.0.0"
 APP_PURPOSE = "Displays notifications delivered by your organization."
 SCAN_INTERVAL_SECONDS = DEFAULT_SCAN_INTERVAL_SECONDS
 SETTINGS_REFRESH_INTERVAL_MS = 15000
+# Safety-net poll used while registry change notifications are active.
+SETTINGS_FALLBACK_INTERVAL_MS = 300000
+DEFAULT_SOUND_PATH = Path(os.environ.get("WINDIR", "C:\\Windows")) / "Media" / "Windows Notify System Generic.wav"
 DEFAULT_MODULES_DIR = Path(
     os.environ.get(
         "WINDOWS_NOTIFIER_MODULES",
@@ -35,6 +41,10 @@ DEFAULT_MODULES_DIR = Path(
     )
 )
 
+# Unscheduled modules sort after every due scheduled module, as if scheduled "now".
+_UNSCHEDULED_SORT_TIME = datetime.max.replace(tzinfo=timezone.utc)
+_TOMBSTONE_SLACK = 16
+
 try:
     import winsound
 except ModuleNotFoundError:  # pragma: no cover - non-Windows environments
@@ -53,19 +63,34 @@ class AppCoordinator(QObject):
         self.modules_dir = Path(self.modules_dir)
         self.modules_dir.mkdir(parents=True, exist_ok=True)
 
-        self._modules: Deque[ModuleDefinition] = deque()
+        # Heap of [sort_time, title, sequence, key, module] entries; _queued maps
+        # module keys to their live heap entry so scans only push what changed.
+        # Removed entries stay in the heap as tombstones (module=None) until popped.
+        self._modules: list[list] = []
+        self._queued: dict[str, list] = {}
+        self._queue_sequence = itertools.count()
         self._current_module: Optional[ModuleDefinition] = None
         self._current_registry_key: Optional[str] = None
         self._manual_shutdown_requested = False
-
-        self._popup = NotificationPopup()
+        self._default_sound_path = _resolve_default_sound()
+        # Created on first playback so QtMultimedia is only imported when sound is used.
+        self._sound_effect = None
+        self._sound_effect_created = False
+
+        # The popup outlives this coordinator across restarts, so dispose()
+        # disconnects exactly these slots and nothing else.
+        self._popup = get_notification_popup()
         self._idle_monitor = IdleMonitor()
 
-        self._popup.clicked.connect(self._on_popup_clicked)
-        self._popup.closed.connect(self._on_popup_closed)
-        self._popup.showMeHow.connect(self._on_show_me_how)
-        self._popup.understood.connect(self._on_understood)
-        self._popup.remindLater.connect(self._on_remind_later)
+        self._popup_connections = (
+            (self._popup.clicked, self._on_popup_clicked),
+            (self._popup.closed, self._on_popup_closed),
+            (self._popup.showMeHow, self._on_show_me_how),
+            (self._popup.understood, self._on_understood),
+            (self._popup.remindLater, self._on_remind_later),
+        )
+        for signal, slot in self._popup_connections:
+            signal.connect(slot)
 
         self._idle_monitor.idleReached.connect(self._on_idle_reached)
 
@@ -95,22 +120,48 @@ class AppCoordinator(QObject):
         self._settings_timer = QTimer(self)
         self._settings_timer.setInterval(SETTINGS_REFRESH_INTERVAL_MS)
         self._settings_timer.timeout.connect(self._reload_settings)
+        self._settings_watcher = RegistryWatcher(self.settings_manager.hive, SETTINGS_SUBKEY, self)
+        self._settings_watcher.changed.connect(self._on_settings_changed)
+        self._settings_watcher.finished.connect(self._on_settings_watch_ended)
+        QApplication.instance().aboutToQuit.connect(self._settings_watcher.stop)
+        QApplication.instance().aboutToQuit.connect(self.registry.close)
 
     def start(self) -> None:
         self._logger.info("Starting application coordinator. Monitoring %s", self.modules_dir)
         initial_settings = getattr(self, "_initial_settings", CoreSettings())
         self._apply_settings(initial_settings, initial=True)
+        if self._settings_watcher.watch():
+            self._logger.debug("Watching registry for settings changes.")
+            self.settings_manager.set_change_tracking(True)
+            self._settings_timer.setInterval(SETTINGS_FALLBACK_INTERVAL_MS)
         self._settings_timer.start()
 
     def shutdown(self) -> None:
         self._logger.info("Shutting down application on user request.")
         self._manual_shutdown_requested = True
         self._scan_timer.stop()
+        self._settings_watcher.stop()
         self._idle_monitor.stop()
         self._popup.hide()
         self._tray.hide()
         QApplication.instance().quit()
 
+    def dispose(self) -> None:
+        """Release the tray icon, timers, and quit hooks so a new coordinator can take over."""
+        self._scan_timer.stop()
+        self._settings_timer.stop()
+        self._settings_watcher.stop()
+        self._idle_monitor.stop()
+        self._popup.hide()
+        for signal, slot in self._popup_connections:
+            signal.disconnect(slot)
+        self._tray.hide()
+        app = QApplication.instance()
+        app.aboutToQuit.disconnect(self._settings_watcher.stop)
+        app.aboutToQuit.disconnect(self.registry.close)
+        self.registry.close()
+        self.deleteLater()
+
     @property
     def manual_shutdown_requested(self) -> bool:
         return self._manual_shutdown_requested
@@ -122,6 +173,15 @@ class AppCoordinator(QObject):
         self._logger.info("Manual refresh triggered from tray menu.")
         self._refresh_modules()
 
+    def _on_settings_changed(self) -> None:
+        self.settings_manager.invalidate()
+        self._reload_settings()
+
+    def _on_settings_watch_ended(self) -> None:
+        # Without change reports the manager must read the registry every time.
+        self.settings_manager.set_change_tracking(False)
+        self._settings_timer.setInterval(SETTINGS_REFRESH_INTERVAL_MS)
+
     def _reload_settings(self) -> None:
         new_settings = self.settings_manager.read_settings()
         if new_settings != self._settings:
@@ -169,32 +229,31 @@ class AppCoordinator(QObject):
         if not self._settings.enabled:
             self._logger.debug("Skipping module refresh; core disabled by policy.")
             return
+        current_time = datetime.now(timezone.utc)
         result = scan_modules(
             self.modules_dir,
             registry=self.registry,
+            now=current_time,
             scan_interval_seconds=self._settings.scan_interval_seconds,
         )
-        self._handle_load_result(result)
+        self._handle_load_result(result, now=current_time)
         if self._current_module is None:
             self._process_next_module()
 
     def _on_scan_timer(self) -> None:
         self._refresh_modules()
 
-    def _handle_load_result(self, result: LoadResult) -> None:
+    def _handle_load_result(self, result: LoadResult, *, now: datetime) -> None:
         for path, error in result.errors:
             self._logger.error("Failed to load module at %s: %s", path, error)
 
-        now = datetime.now(timezone.utc)
-        due_list: list[ModuleDefinition] = []
+        due: dict[str, ModuleDefinition] = {}
         future_count = 0
-        seen_keys: set[str] = set()
 
         for module in result.modules:
             key = module.module_key or module.root.name
-            if key in seen_keys:
+            if key in due:
                 continue
-            seen_keys.add(key)
 
             if key == self._current_registry_key:
                 continue
@@ -204,16 +263,36 @@ class AppCoordinator(QObject):
                 future_count += 1
                 continue
 
-            due_list.append(module)
+            due[key] = module
+
+        stale_keys = {key for key in self._queued if key not in due}
+        new_entries: list[list] = []
+        for key, module in due.items():
+            sort_time = module.scheduled_utc or _UNSCHEDULED_SORT_TIME
+            entry = self._queued.get(key)
+            if entry is not None:
+                if entry[0] == sort_time and entry[1] == module.title:
+                    entry[4] = module
+                    continue
+                stale_keys.add(key)
+            new_entries.append([sort_time, module.title, next(self._queue_sequence), key, module])
+
+        for key in stale_keys:
+            self._queued.pop(key)[4] = None
+
+        for entry in new_entries:
+            self._queued[entry[3]] = entry
+            heapq.heappush(self._modules, entry)
+
+        if len(self._modules) > 2 * len(self._queued) + _TOMBSTONE_SLACK:
+            self._modules = [entry for entry in self._modules if entry[4] is not None]
+            heapq.heapify(self._modules)
 
-        sorted_due = sorted(
-            due_list,
-            key=lambda m: ((m.scheduled_utc or now), m.title),
-        )
-        self._modules = deque(sorted_due)
         self._logger.info(
-            "Modules ready: %d, waiting for schedule: %d",
-            len(self._modules),
+            "Modules ready: %d (added %d, removed %d), waiting for schedule: %d",
+            len(self._queued),
+            len(new_entries),
+            len(stale_keys),
             future_count,
         )
 
@@ -221,14 +300,16 @@ class AppCoordinator(QObject):
         if self._current_module is not None:
             return
 
-        if not self._modules:
+        if not self._queued:
             self._logger.debug("No due modules to display.")
             self._popup.hide()
             return
 
         while self._modules:
-            module = self._modules.popleft()
-            key = module.module_key or module.root.name
+            _, _, _, key, module = heapq.heappop(self._modules)
+            if module is None:
+                continue
+            del self._queued[key]
             self._current_module = module
             self._current_registry_key = key
 
@@ -319,19 +400,28 @@ class AppCoordinator(QObject):
         if module.sound_setting != "windows_default":
             self._logger.warning("Unsupported sound setting '%s'", module.sound_setting)
             return
-        if winsound is None:
-            self._logger.warning("winsound module not available; cannot play sound.")
+        sound_path = self._default_sound_path
+        if sound_path is None:
+            self._logger.warning("Default notification sound not found at %s", DEFAULT_SOUND_PATH)
             return
 
-        sound_path = Path(os.environ.get("WINDIR", "C:\\Windows")) / "Media" / "Windows Notify System Generic.wav"
-        if not sound_path.exists():
-            self._logger.warning("Default notification sound not found at %s", sound_path)
+        if not self._sound_effect_created:
+            self._sound_effect_created = True
+            self._sound_effect = _create_sound_effect(sound_path, parent=self)
+        effect = self._sound_effect
+        if effect is not None and effect.status() != effect.Status.Error:
+            effect.play()
+            return
+
+        if winsound is None:
+            self._logger.warning("winsound module not available; cannot play sound.")
             return
 
         try:
             winsound.PlaySound(str(sound_path), winsound.SND_FILENAME | winsound.SND_ASYNC)
         except RuntimeError as exc:  # pragma: no cover - difficult to simulate
             self._logger.error("Failed to play notification sound: %s", exc)
+            self._default_sound_path = _resolve_default_sound()
 
     def _open_module_media(self, module: ModuleDefinition) -> None:
         if module.media_path and module.media_path.exists():
@@ -346,19 +436,26 @@ class AppCoordinator(QObject):
     def _delete_module_folder(self, path: Path) -> None:
         self._logger.debug("Deleting module folder %s", path)
         try:
-            self._safe_delete_folder(path)
+            safe_delete_folder(path)
         except OSError as exc:
             self._logger.error("Failed to delete module folder %s: %s", path, exc)
 
-    def _safe_delete_folder(self, path: Path) -> None:
-        if not path.exists():
-            return
-
-        for child in path.iterdir():
-            if child.is_dir():
-                self._safe_delete_folder(child)
-            else:
-                child.unlink(missing_ok=True)
-        path.rmdir()
-
 
+def _resolve_default_sound() -> Optional[Path]:
+    return DEFAULT_SOUND_PATH if DEFAULT_SOUND_PATH.exists() else None
+
+
+def _create_sound_effect(path: Optional[Path], parent: Optional[QObject] = None):
+    """
+    Load ``path`` into a QSoundEffect, or return None so playback falls back
+    to winsound when QtMultimedia or the sound file is unavailable.
+    """
+    if path is None or not path.exists():
+        return None
+    try:
+        from PySide6.QtMultimedia import QSoundEffect
+    except ImportError:
+        return None
+    effect = QSoundEffect(parent)
+    effect.setSource(QUrl.fromLocalFile(str(path)))
+    return effect
@@ -4,26 +4,63 @@ Top-level window responsible for rendering module media content.
 
 from __future__ import annotations
 
-from PySide6.QtWidgets import QMainWindow, QWidget
+from PySide6.QtCore import QUrl
+from PySide6.QtGui import QDesktopServices
+from PySide6.QtWidgets import QMainWindow, QStackedWidget, QWidget
 
 from shared.module_definition import ModuleDefinition
-from core.media_viewer import choose_viewer
+from core.media_viewer import (
+    EXTERNAL_CONTENT_MESSAGE,
+    NO_PREVIEW_MESSAGE,
+    build_message_widget,
+    create_viewer,
+    load_viewer,
+    media_kind,
+    set_message,
+    stop_viewer,
+)
 
 
 class ContentWindow(QMainWindow):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Notification Content")
-        self._current_widget: QWidget | None = None
+        self._stack = QStackedWidget(self)
+        self.setCentralWidget(self._stack)
+        # Viewers are created on first use and reused for later modules so
+        # expensive widgets (WebEngine, media player) are only built once.
+        self._viewers: dict[str, QWidget] = {}
+        self._message_widget: QWidget | None = None
+        self._active_kind: str | None = None
 
     def show_content(self, module: ModuleDefinition) -> None:
         """Render the module's media inside the window."""
-        widget = choose_viewer(module)
-        self._set_central_widget(widget)
+        if self._active_kind is not None:
+            stop_viewer(self._active_kind, self._viewers[self._active_kind])
+            self._active_kind = None
+
+        kind = media_kind(module)
+        if kind == "url":
+            QDesktopServices.openUrl(QUrl(module.media_url))
+            widget = self._show_message(EXTERNAL_CONTENT_MESSAGE)
+        elif kind is None:
+            widget = self._show_message(NO_PREVIEW_MESSAGE)
+        else:
+            widget = self._viewers.get(kind)
+            if widget is None:
+                widget = create_viewer(kind)
+                self._viewers[kind] = widget
+                self._stack.addWidget(widget)
+            load_viewer(kind, widget, module.media_path)
+            self._active_kind = kind
+
+        self._stack.setCurrentWidget(widget)
         self.show()
 
-    def _set_central_widget(self, widget: QWidget) -> None:
-        if self._current_widget is not None:
-            self._current_widget.setParent(None)
-        self._current_widget = widget
-        self.setCentralWidget(widget)
+    def _show_message(self, message: str) -> QWidget:
+        if self._message_widget is None:
+            self._message_widget = build_message_widget(message)
+            self._stack.addWidget(self._message_widget)
+        else:
+            set_message(self._message_widget, message)
+        return self._message_widget
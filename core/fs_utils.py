@@ -0,0 +1,16 @@
+"""
+Filesystem helpers shared by the core runtime.
+"""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+
+def safe_delete_folder(path: Path) -> None:
+    """Delete a module folder tree, ignoring missing-directory errors."""
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        pass
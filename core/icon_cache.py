@@ -0,0 +1,52 @@
+"""
+Process-wide cache of QStyle standard icons used by the notification UI.
+"""
+
+from __future__ import annotations
+
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtWidgets import QApplication, QStyle
+
+# Standard icons referenced by the popup buttons and icon presets.
+PRELOADED_ICONS = (
+    QStyle.StandardPixmap.SP_MessageBoxInformation,
+    QStyle.StandardPixmap.SP_MessageBoxWarning,
+    QStyle.StandardPixmap.SP_BrowserReload,
+    QStyle.StandardPixmap.SP_DialogApplyButton,
+    QStyle.StandardPixmap.SP_FileDialogDetailedView,
+)
+PRELOADED_SIZES = (48, 26)
+
+_ICONS: dict[QStyle.StandardPixmap, QIcon] = {}
+_PIXMAPS: dict[tuple[QStyle.StandardPixmap, int], QPixmap] = {}
+
+
+def preload(app: QApplication) -> None:
+    """Resolve the notification UI's standard icons from ``app``'s style."""
+    _ICONS.clear()
+    _PIXMAPS.clear()
+    style = app.style()
+    for icon_id in PRELOADED_ICONS:
+        icon = style.standardIcon(icon_id)
+        _ICONS[icon_id] = icon
+        for size in PRELOADED_SIZES:
+            _PIXMAPS[(icon_id, size)] = icon.pixmap(size, size)
+
+
+def standard_icon(icon_id: QStyle.StandardPixmap) -> QIcon:
+    """Return a cached standard icon, resolving it on first use if not preloaded."""
+    icon = _ICONS.get(icon_id)
+    if icon is None:
+        icon = QApplication.style().standardIcon(icon_id)
+        _ICONS[icon_id] = icon
+    return icon
+
+
+def standard_pixmap(icon_id: QStyle.StandardPixmap, size: int) -> QPixmap:
+    """Return a cached square pixmap of a standard icon."""
+    key = (icon_id, size)
+    pixmap = _PIXMAPS.get(key)
+    if pixmap is None:
+        pixmap = standard_icon(icon_id).pixmap(size, size)
+        _PIXMAPS[key] = pixmap
+    return pixmap
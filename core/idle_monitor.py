@@ -13,8 +13,13 @@ from PySide6.QtCore import QObject, QTimer, Signal
 
 class IdleMonitor(QObject):
     """
-    Periodically polls system idle time and emits a signal once the configured
-    threshold is exceeded. Monitoring halts after emission until restarted.
+    Emits a signal once system idle time exceeds the configured threshold.
+
+    Rather than polling at a fixed rate, a single-shot timer is armed for the
+    time remaining until the threshold could be reached and re-armed for the
+    new remainder whenever input has occurred in the meantime. The poll
+    interval acts as the minimum delay between checks. Monitoring halts after
+    emission until restarted.
     """
 
     idleReached = Signal()
@@ -24,7 +29,7 @@ class IdleMonitor(QObject):
         self.threshold_seconds = threshold_seconds
         self._poll_interval_ms = poll_interval_ms
         self._timer = QTimer(self)
-        self._timer.setInterval(self._poll_interval_ms)
+        self._timer.setSingleShot(True)
         self._timer.timeout.connect(self._check_idle)  # type: ignore[arg-type]
         self._active = False
         self._idle_seconds_provider: Optional[Callable[[], float]] = None
@@ -34,7 +39,8 @@ class IdleMonitor(QObject):
         if self._active:
             return
         self._active = True
-        self._timer.start()
+        # Defer the first check to the event loop so idleReached is never emitted from start().
+        self._timer.start(0)
 
     def stop(self) -> None:
         """Stop monitoring."""
@@ -61,8 +67,12 @@ class IdleMonitor(QObject):
             return
 
         if idle_seconds >= self.threshold_seconds:
-            self.idleReached.emit()
             self.stop()
+            self.idleReached.emit()
+            return
+
+        remaining_ms = int((self.threshold_seconds - idle_seconds) * 1000)
+        self._timer.start(max(self._poll_interval_ms, remaining_ms))
 
     def _get_idle_seconds(self) -> float:
         if self._idle_seconds_provider is not None:
@@ -70,26 +80,46 @@ class IdleMonitor(QObject):
 
         last_input_info = _get_last_input_info()
         tick_count_ms = _get_tick_count_ms()
-        idle_ms = max(0, tick_count_ms - last_input_info)
+        # dwTime is a 32-bit tick count, so compare modulo 2**32 to survive wraparound.
+        idle_ms = (tick_count_ms - last_input_info) & 0xFFFFFFFF
         return idle_ms / 1000.0
 
 
-def _get_last_input_info() -> int:
-    class LASTINPUTINFO(ctypes.Structure):
-        _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+class _LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+
+_last_input = _LASTINPUTINFO()
+_last_input.cbSize = ctypes.sizeof(_LASTINPUTINFO)
+_get_last_input_info_fn: Optional[Callable[..., int]] = None
+_get_tick_count_fn: Optional[Callable[[], int]] = None
 
-    user32 = ctypes.windll.user32  # type: ignore[attr-defined]
-    last_input = LASTINPUTINFO()
-    last_input.cbSize = ctypes.sizeof(LASTINPUTINFO)
 
-    if not user32.GetLastInputInfo(ctypes.byref(last_input)):
-        raise ctypes.WinError()
+def _get_last_input_info() -> int:
+    global _get_last_input_info_fn
+    if _get_last_input_info_fn is None:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)  # type: ignore[attr-defined]
+        function = user32.GetLastInputInfo
+        function.argtypes = [ctypes.POINTER(_LASTINPUTINFO)]
+        function.restype = ctypes.c_int
+        _get_last_input_info_fn = function
+
+    if not _get_last_input_info_fn(ctypes.byref(_last_input)):
+        raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
 
-    return last_input.dwTime
+    return _last_input.dwTime
 
 
 def _get_tick_count_ms() -> int:
-    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-    if hasattr(kernel32, "GetTickCount64"):
-        return int(kernel32.GetTickCount64())
-    return int(kernel32.GetTickCount())
+    global _get_tick_count_fn
+    if _get_tick_count_fn is None:
+        kernel32 = ctypes.WinDLL("kernel32")  # type: ignore[attr-defined]
+        if hasattr(kernel32, "GetTickCount64"):
+            function = kernel32.GetTickCount64
+            function.restype = ctypes.c_ulonglong
+        else:
+            function = kernel32.GetTickCount
+            function.restype = ctypes.c_uint
+        function.argtypes = []
+        _get_tick_count_fn = function
+    return int(_get_tick_count_fn())
@@ -8,91 +8,215 @@ from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import Qt, QUrl
-from PySide6.QtGui import QDesktopServices, QMovie, QPixmap
+from PySide6.QtGui import QDesktopServices, QMovie, QPixmap, QPixmapCache
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
-try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView
-except ImportError:  # pragma: no cover - optional dependency
-    QWebEngineView = None  # type: ignore
+from shared.module_definition import ModuleDefinition
 
-try:
-    from PySide6.QtMultimedia import QMediaPlayer
-    from PySide6.QtMultimediaWidgets import QVideoWidget
-except ImportError:  # pragma: no cover - optional dependency
-    QMediaPlayer = None  # type: ignore
-    QVideoWidget = None  # type: ignore
+EXTERNAL_CONTENT_MESSAGE = "Opened external content in default browser."
+NO_PREVIEW_MESSAGE = "No preview available for this media."
+_PIXMAP_CACHE_LIMIT_KB = 65536
+_pixmap_cache_configured = False
 
-from shared.module_definition import ModuleDefinition
+# QtWebEngine and QtMultimedia are optional and expensive to load, so they are
+# imported on first use. None means the import has not been attempted yet.
+_webengine_available: Optional[bool] = None
+_multimedia_available: Optional[bool] = None
+QWebEngineView = None  # type: ignore
+QMediaPlayer = None  # type: ignore
+QVideoWidget = None  # type: ignore
 
 
 def choose_viewer(module: ModuleDefinition) -> QWidget:
     """
     Return an appropriate widget for presenting the module's media asset.
     """
-    if module.media_url:
+    kind = media_kind(module)
+    if kind == "url":
         QDesktopServices.openUrl(QUrl(module.media_url))
-        return _build_message_widget("Opened external content in default browser.")
+        return build_message_widget(EXTERNAL_CONTENT_MESSAGE)
+    if kind is None:
+        return build_message_widget(NO_PREVIEW_MESSAGE)
+
+    widget = create_viewer(kind)
+    load_viewer(kind, widget, module.media_path)
+    return widget
+
+
+def media_kind(module: ModuleDefinition) -> Optional[str]:
+    """
+    Classify the module's media as "url", "pdf", "video", "image", or "gif".
+
+    Returns None when no viewer is available for the media.
+    """
+    if module.media_url:
+        return "url"
 
     if module.media_path:
-        suffix = module.media_path.suffix.lower()
-        if suffix == ".pdf" and QWebEngineView is not None:
-            return _build_pdf_viewer(module.media_path)
-        if suffix in {".mp4", ".mov"} and QMediaPlayer is not None and QVideoWidget is not None:
-            return _build_video_player(module.media_path)
-        if suffix in {".png", ".jpg", ".jpeg"}:
-            return _build_image_viewer(module.media_path)
-        if suffix == ".gif":
-            return _build_gif_viewer(module.media_path)
+        kind, is_available = _SUFFIX_KINDS.get(module.media_path.suffix.lower(), (None, None))
+        if kind is not None and (is_available is None or is_available()):
+            return kind
+
+    return None
+
+
+def create_viewer(kind: str) -> QWidget:
+    """Construct an empty viewer widget for the given media kind."""
+    return _VIEWER_FACTORIES[kind]()
+
+
+def load_viewer(kind: str, widget: QWidget, path: Path) -> None:
+    """Point an existing viewer widget of the given kind at a new media file."""
+    _VIEWER_LOADERS[kind](widget, path)
+
+
+def stop_viewer(kind: str, widget: QWidget) -> None:
+    """Halt any playback running in a viewer before it is hidden or reused."""
+    if kind == "video":
+        widget._media_player.stop()  # type: ignore[attr-defined]
+    elif kind == "gif":
+        movie = widget.movie()
+        if movie is not None:
+            movie.stop()
 
-    return _build_message_widget("No preview available for this media.")
 
+def set_message(widget: QWidget, message: str) -> None:
+    """Update the text of a widget built by the message viewer."""
+    widget._label.setText(message)  # type: ignore[attr-defined]
 
-def _build_message_widget(message: str) -> QWidget:
+
+def build_message_widget(message: str) -> QWidget:
+    """Return a widget showing a centred status message."""
     widget = QWidget()
     layout = QVBoxLayout(widget)
     label = QLabel(message)
     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
     layout.addWidget(label)
+    widget._label = label  # type: ignore[attr-defined]
     return widget
 
 
-def _build_pdf_viewer(path: Path) -> QWidget:
-    view = QWebEngineView()
+def _has_webengine() -> bool:
+    global QWebEngineView, _webengine_available
+    if _webengine_available is None:
+        try:
+            from PySide6.QtWebEngineWidgets import QWebEngineView as view_class
+        except ImportError:  # pragma: no cover - optional dependency
+            _webengine_available = False
+        else:
+            QWebEngineView = view_class
+            _webengine_available = True
+    return _webengine_available
+
+
+def _has_multimedia() -> bool:
+    global QMediaPlayer, QVideoWidget, _multimedia_available
+    if _multimedia_available is None:
+        try:
+            from PySide6.QtMultimedia import QMediaPlayer as player_class
+            from PySide6.QtMultimediaWidgets import QVideoWidget as video_widget_class
+        except ImportError:  # pragma: no cover - optional dependency
+            _multimedia_available = False
+        else:
+            QMediaPlayer = player_class
+            QVideoWidget = video_widget_class
+            _multimedia_available = True
+    return _multimedia_available
+
+
+def _create_pdf_viewer() -> QWidget:
+    return QWebEngineView()
+
+
+def _load_pdf(view: QWidget, path: Path) -> None:
     view.setUrl(QUrl.fromLocalFile(str(path)))
-    return view
 
 
-def _build_video_player(path: Path) -> QWidget:
+def _create_video_player() -> QWidget:
     container = QWidget()
     layout = QVBoxLayout(container)
     video_widget = QVideoWidget(container)
     layout.addWidget(video_widget)
     player = QMediaPlayer(container)
     player.setVideoOutput(video_widget)
-    player.setSource(QUrl.fromLocalFile(str(path)))
     container._media_player = player  # type: ignore[attr-defined]
     return container
 
 
-def _build_image_viewer(path: Path) -> QWidget:
+def _load_video(container: QWidget, path: Path) -> None:
+    container._media_player.setSource(QUrl.fromLocalFile(str(path)))  # type: ignore[attr-defined]
+
+
+def _create_label() -> QWidget:
     label = QLabel()
     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    pixmap = QPixmap(str(path))
+    return label
+
+
+def _load_image(label: QLabel, path: Path) -> None:
+    pixmap = _load_cached_pixmap(path)
     if pixmap.isNull():
         label.setText("Image unavailable.")
     else:
         label.setPixmap(pixmap)
-    return label
 
 
-def _build_gif_viewer(path: Path) -> QWidget:
-    label = QLabel()
-    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    movie = QMovie(str(path))
+def _load_cached_pixmap(path: Path) -> QPixmap:
+    """Decode an image once per file version using the shared QPixmapCache."""
+    global _pixmap_cache_configured
+    if not _pixmap_cache_configured:
+        QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT_KB)
+        _pixmap_cache_configured = True
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return QPixmap()
+
+    key = f"media:{path}|{stat.st_mtime_ns}|{stat.st_size}"
+    pixmap = QPixmap()
+    if not QPixmapCache.find(key, pixmap):
+        pixmap = QPixmap(str(path))
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _load_gif(label: QLabel, path: Path) -> None:
+    previous = label.movie()
+    if previous is not None:
+        previous.stop()
+        previous.deleteLater()
+    movie = QMovie(str(path), parent=label)
     if movie.isValid():
         label.setMovie(movie)
         movie.start()
     else:
+        movie.deleteLater()
         label.setText("Animation unavailable.")
-    return label
+
+
+_VIEWER_FACTORIES = {
+    "pdf": _create_pdf_viewer,
+    "video": _create_video_player,
+    "image": _create_label,
+    "gif": _create_label,
+}
+
+_VIEWER_LOADERS = {
+    "pdf": _load_pdf,
+    "video": _load_video,
+    "image": _load_image,
+    "gif": _load_gif,
+}
+
+# Media suffix -> (viewer kind, capability check or None when always available).
+_SUFFIX_KINDS = {
+    ".pdf": ("pdf", _has_webengine),
+    ".mp4": ("video", _has_multimedia),
+    ".mov": ("video", _has_multimedia),
+    ".png": ("image", None),
+    ".jpg": ("image", None),
+    ".jpeg": ("image", None),
+    ".gif": ("gif", None),
+}
@@ -8,40 +8,110 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Optional
 
 from shared.module_definition import ModuleDefinition
 
+_CHUNK_SIZE = 1 << 20
+_HASH_CACHE_MAX_ENTRIES = 1024
+_HASH_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_HASH_CACHE_LOCK = threading.Lock()
 
-def compute_module_id(module: ModuleDefinition) -> str:
+
+def compute_module_id(module: ModuleDefinition, *, cache: Optional[OrderedDict] = _HASH_CACHE) -> str:
     """
     Compute a deterministic SHA-256 hash for the provided module.
 
     The manifest dict is canonicalised to JSON with sorted keys and
     compact separators. Media content (either file bytes or URL string)
     is folded into the same digest to ensure updates are reflected.
+
+    Results are memoised by manifest content plus the path, mtime, and size
+    of referenced files so unchanged modules are not re-read on every scan.
+    Pass ``cache=None`` to force a full computation.
     """
+    manifest_json = json.dumps(module.manifest, sort_keys=True, separators=(",", ":"))
+
+    if cache is None:
+        return _compute_digest(module, manifest_json)
+
+    key = (
+        manifest_json,
+        _file_signature(module.media_path) if module.media_path is not None else module.media_url,
+        _file_signature(module.icon_path) if module.icon_path is not None else module.icon_url,
+    )
+    with _HASH_CACHE_LOCK:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+
+    module_id = _compute_digest(module, manifest_json)
+    with _HASH_CACHE_LOCK:
+        cache[key] = module_id
+        if len(cache) > _HASH_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    return module_id
+
+
+def _compute_digest(module: ModuleDefinition, manifest_json: str) -> str:
     digest = hashlib.sha256()
 
-    manifest_json = json.dumps(module.manifest, sort_keys=True, separators=(",", ":"))
-    digest.update(manifest_json.encode("utf-8"))
+    # Small inputs are buffered and fed to the digest in a single update;
+    # files are streamed in between so the digested byte sequence is unchanged.
+    pending = [manifest_json.encode("utf-8")]
 
     if module.media_path is not None:
-        digest.update(_read_file_bytes(module.media_path))
+        _flush_pending(digest, pending)
+        _update_digest_from_file(digest, module.media_path)
     elif module.media_url is not None:
-        digest.update(module.media_url.encode("utf-8"))
+        pending.append(module.media_url.encode("utf-8"))
 
     if module.icon_path is not None:
-        digest.update(_read_file_bytes(module.icon_path))
+        _flush_pending(digest, pending)
+        _update_digest_from_file(digest, module.icon_path)
     elif module.icon_url is not None:
-        digest.update(module.icon_url.encode("utf-8"))
+        pending.append(module.icon_url.encode("utf-8"))
 
+    _flush_pending(digest, pending)
     return digest.hexdigest()
 
 
-def _read_file_bytes(path: Path) -> bytes:
-    """Read file bytes, raising a descriptive error if unavailable."""
+def _flush_pending(digest, pending: list[bytes]) -> None:
+    """Feed buffered byte chunks to the digest as one contiguous update."""
+    if pending:
+        digest.update(b"".join(pending))
+        pending.clear()
+
+
+def _file_signature(path: Path) -> tuple[str, int, int]:
+    """Return a cheap (path, mtime_ns, size) fingerprint for cache lookups."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"File not found for module ID computation: {path}") from exc
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _update_digest_from_file(digest, path: Path) -> None:
+    """Feed file bytes into the digest, raising a descriptive error if unavailable."""
     try:
-        return path.read_bytes()
+        with path.open("rb", buffering=0) as handle:
+            # Hash a read-only mapping in one update so the bytes are never copied
+            # into Python buffers; empty or unmappable files are streamed instead.
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+                    return
+            except (ValueError, OSError):
+                pass
+            buffer = memoryview(bytearray(_CHUNK_SIZE))
+            while count := handle.readinto(buffer):
+                digest.update(buffer[:count])
     except FileNotFoundError as exc:
         raise FileNotFoundError(f"File not found for module ID computation: {path}") from exc
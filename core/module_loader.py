@@ -4,11 +4,16 @@ Module discovery utilities for the WindowsNotifier runtime.
 
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from shared.manifest_schema import (
     ManifestValidationError,
@@ -16,10 +21,20 @@ from shared.manifest_schema import (
     parse_iso8601_utc,
 )
 from shared.module_definition import ModuleDefinition
+from core.fs_utils import safe_delete_folder
 from core.module_id import compute_module_id
 from core.registry_store import ConditionState, ModuleStatus, RegistryStore
 
 DEFAULT_SCAN_INTERVAL_SECONDS = 300
+_MAX_SCAN_WORKERS = 32
+_MANIFEST_CACHE_MAX_ENTRIES = 512
+_MANIFEST_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_MANIFEST_CACHE_LOCK = threading.Lock()
+_POWERSHELL_EXE = shutil.which("powershell.exe") or "powershell.exe"
+_PS_ARGV_PREFIX = (_POWERSHELL_EXE, "-NoProfile", "-ExecutionPolicy", "Bypass")
+_PS_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+# Scan workers share this so condition scripts still run one powershell.exe at a time.
+_CONDITION_SCRIPT_LOCK = threading.Lock()
 
 @dataclass(slots=True)
 class LoadResult:
@@ -37,103 +52,175 @@ def scan_modules(
     """
     Inspect module subdirectories, validate manifests, resolve identities, and
     filter according to registry state.
+
+    Module folders are processed concurrently on a thread pool; registry
+    access and condition scripts are serialised, and each module's stored
+    values are read with one RegistryStore.snapshot call.
+    Modules are returned in directory iteration order (display order is
+    decided by the caller); errors are sorted by module path.
     """
-    registry = registry or RegistryStore()
+    registry = _SynchronizedRegistry(registry or RegistryStore())
     modules: List[ModuleDefinition] = []
     errors: List[Tuple[Path, Exception]] = []
     current_time = now or datetime.now(timezone.utc)
+    # Naive times are treated as UTC, as ModuleDefinition.is_expired always has.
+    current_epoch = (
+        current_time if current_time.tzinfo is not None else current_time.replace(tzinfo=timezone.utc)
+    ).timestamp()
 
     try:
-        subdirs = [p for p in modules_dir.iterdir() if p.is_dir()]
+        with os.scandir(modules_dir) as entries:
+            subdirs = [Path(entry.path) for entry in entries if entry.is_dir(follow_symlinks=False)]
     except FileNotFoundError:
         return LoadResult(modules=[], errors=[])
 
-    for module_path in sorted(subdirs):
-        manifest_path = module_path / "manifest.json"
-        if not manifest_path.exists():
-            errors.append((module_path, FileNotFoundError(f"Missing manifest.json in {module_path}")))
-            continue
-
-        try:
-            manifest = load_and_validate_manifest(manifest_path)
-            module = ModuleDefinition(root=module_path, manifest=manifest)
-            key = module.module_key or module_path.name
-            new_hash = compute_module_id(module)
-            stored_hash = registry.get_module_hash(key)
-            stored_schedule = registry.get_schedule(key)
-
-            override_schedule = False
-            if stored_schedule:
-                try:
-                    module.scheduled_utc = parse_iso8601_utc(stored_schedule)
-                except ManifestValidationError:
-                    override_schedule = True
-            else:
-                override_schedule = True
-
-            if stored_hash != new_hash:
-                registry.set_module_hash(key, new_hash)
-                registry.mark_first_seen(key, title=module.title, category=module.category)
-                if module.is_conditional:
-                    registry.set_condition_state(key, ConditionState.WAITING)
-                    registry.set_condition_next_run(key, current_time)
-                else:
-                    registry.clear_condition_tracking(key)
-                status = ModuleStatus.PENDING
-                override_schedule = True
-            else:
-                status = registry.get_status(key)
+    if not subdirs:
+        return LoadResult(modules=modules, errors=errors)
+
+    max_workers = min(_MAX_SCAN_WORKERS, (os.cpu_count() or 1) * 4, len(subdirs))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="module-scan") as executor:
+        results = executor.map(
+            lambda module_path: _process_one_module(
+                module_path,
+                registry=registry,
+                current_time=current_time,
+                current_epoch=current_epoch,
+                scan_interval_seconds=scan_interval_seconds,
+            ),
+            subdirs,
+        )
+        for module, module_errors in results:
+            errors.extend(module_errors)
+            if module is not None:
+                modules.append(module)
 
-            if override_schedule:
-                registry.set_schedule(key, module.scheduled_utc)
-        except (ManifestValidationError, OSError, FileNotFoundError) as exc:
-            errors.append((module_path, exc))
-            continue
+    errors.sort(key=lambda error: error[0])
+    return LoadResult(modules=modules, errors=errors)
 
-        try:
-            if status in {ModuleStatus.COMPLETED, ModuleStatus.EXPIRED}:
-                _safe_delete_folder(module_path)
-                continue
 
-            if module.is_expired(reference=current_time):
-                registry.mark_expired(key)
-                _safe_delete_folder(module_path)
-                continue
+def _process_one_module(
+    module_path: Path,
+    *,
+    registry: RegistryStore,
+    current_time: datetime,
+    current_epoch: float,
+    scan_interval_seconds: int,
+) -> Tuple[Optional[ModuleDefinition], List[Tuple[Path, Exception]]]:
+    """Load a single module folder, returning the module if it is ready to display."""
+    errors: List[Tuple[Path, Exception]] = []
+    manifest_path = module_path / "manifest.json"
+    try:
+        manifest_stat = manifest_path.stat()
+    except FileNotFoundError:
+        errors.append((module_path, FileNotFoundError(f"Missing manifest.json in {module_path}")))
+        return None, errors
+    except OSError as exc:
+        errors.append((module_path, exc))
+        return None, errors
 
-            if status is None:
-                registry.mark_first_seen(key, title=module.title, category=module.category)
+    try:
+        manifest = _load_manifest_cached(manifest_path, manifest_stat)
+        module = ModuleDefinition(root=module_path, manifest=manifest)
+        key = module.module_key or module_path.name
+        new_hash = compute_module_id(module)
+        stored = registry.snapshot(key)
+        stored_hash = stored.module_hash
+        stored_schedule = stored.schedule
+
+        override_schedule = False
+        if stored_schedule:
+            try:
+                module.scheduled_utc = parse_iso8601_utc(stored_schedule)
+            except ManifestValidationError:
+                override_schedule = True
+        else:
+            override_schedule = True
 
+        if stored_hash != new_hash:
+            registry.set_module_hash(key, new_hash)
+            registry.mark_first_seen(key, title=module.title, category=module.category)
             if module.is_conditional:
-                ready = _handle_condition_module(
-                    module=module,
-                    key=key,
-                    registry=registry,
-                    module_path=module_path,
-                    current_time=current_time,
-                    scan_interval_seconds=scan_interval_seconds,
-                    errors=errors,
-                )
-                if not ready:
-                    continue
-
-            modules.append(module)
-        except OSError as exc:
-            errors.append((module_path, exc))
-
-    return LoadResult(modules=modules, errors=errors)
-
+                registry.set_condition_state(key, ConditionState.WAITING)
+                registry.set_condition_next_run(key, current_time)
+            else:
+                registry.clear_condition_tracking(key)
+            status = ModuleStatus.PENDING
+            override_schedule = True
+        else:
+            status = stored.status
+
+        if override_schedule:
+            registry.set_schedule(key, module.scheduled_utc)
+    except (ManifestValidationError, OSError, FileNotFoundError) as exc:
+        errors.append((module_path, exc))
+        return None, errors
 
-def _safe_delete_folder(path: Path) -> None:
-    """Attempt to delete a module folder, ignoring missing-directory errors."""
     try:
-        for child in path.iterdir():
-            if child.is_dir():
-                _safe_delete_folder(child)
-            else:
-                child.unlink(missing_ok=True)
-        path.rmdir()
-    except FileNotFoundError:
-        pass
+        if status in {ModuleStatus.COMPLETED, ModuleStatus.EXPIRED}:
+            safe_delete_folder(module_path)
+            return None, errors
+
+        if module.is_expired(reference_epoch=current_epoch):
+            registry.mark_expired(key)
+            safe_delete_folder(module_path)
+            return None, errors
+
+        if status is None:
+            registry.mark_first_seen(key, title=module.title, category=module.category)
+
+        if module.is_conditional:
+            ready = _handle_condition_module(
+                module=module,
+                key=key,
+                registry=registry,
+                module_path=module_path,
+                current_time=current_time,
+                scan_interval_seconds=scan_interval_seconds,
+                errors=errors,
+            )
+            if not ready:
+                return None, errors
+
+        return module, errors
+    except OSError as exc:
+        errors.append((module_path, exc))
+        return None, errors
+
+
+def _load_manifest_cached(manifest_path: Path, manifest_stat: os.stat_result) -> Dict[str, Any]:
+    """Return the validated manifest, reusing the last result while the file is unchanged."""
+    key = (str(manifest_path), manifest_stat.st_mtime_ns, manifest_stat.st_size)
+    with _MANIFEST_CACHE_LOCK:
+        cached = _MANIFEST_CACHE.get(key)
+        if cached is not None:
+            _MANIFEST_CACHE.move_to_end(key)
+            return dict(cached)
+
+    manifest = load_and_validate_manifest(manifest_path)
+    with _MANIFEST_CACHE_LOCK:
+        _MANIFEST_CACHE[key] = manifest
+        if len(_MANIFEST_CACHE) > _MANIFEST_CACHE_MAX_ENTRIES:
+            _MANIFEST_CACHE.popitem(last=False)
+    return dict(manifest)
+
+
+class _SynchronizedRegistry:
+    """Proxy serialising RegistryStore calls made from scan worker threads."""
+
+    def __init__(self, registry: RegistryStore) -> None:
+        self._registry = registry
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._registry, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+
+        return locked
 
 
 def _handle_condition_module(
@@ -151,17 +238,19 @@ def _handle_condition_module(
         registry.set_condition_error(key, message)
         if errors is not None:
             errors.append((module_path, RuntimeError(message)))
-        _safe_delete_folder(module_path)
+        safe_delete_folder(module_path)
         return False
 
-    state = registry.get_condition_state(key)
+    # Re-read after any writes made by the caller; writes drop the store's cached snapshot.
+    stored = registry.snapshot(key)
+    state = stored.condition_state
     if state == ConditionState.ERROR:
-        _safe_delete_folder(module_path)
+        safe_delete_folder(module_path)
         return False
     if state == ConditionState.TRIGGERED:
         return True
 
-    next_run = registry.get_condition_next_run(key)
+    next_run = stored.condition_next_run
     if next_run and next_run > current_time:
         return False
 
@@ -173,7 +262,7 @@ def _handle_condition_module(
         registry.set_condition_error(key, message)
         if errors is not None:
             errors.append((module_path, RuntimeError(message)))
-        _safe_delete_folder(module_path)
+        safe_delete_folder(module_path)
         return False
 
     exit_code, stdout, stderr = result
@@ -192,26 +281,23 @@ def _handle_condition_module(
     registry.set_condition_error(key, message)
     if errors is not None:
         errors.append((module_path, RuntimeError(message)))
-    _safe_delete_folder(module_path)
+    safe_delete_folder(module_path)
     return False
 
 
 def _run_condition_script(script: Path, timeout: int, module_path: Path) -> Tuple[int, str, str] | None:
+    # Each script gets its own powershell.exe so its exit code keeps -File
+    # semantics and no session state carries over between modules.
     try:
-        completed = subprocess.run(
-            [
-                "powershell.exe",
-                "-NoProfile",
-                "-ExecutionPolicy",
-                "Bypass",
-                "-File",
-                str(script),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=str(module_path),
-        )
+        with _CONDITION_SCRIPT_LOCK:
+            completed = subprocess.run(
+                (*_PS_ARGV_PREFIX, "-File", str(script)),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=str(module_path),
+                creationflags=_PS_CREATION_FLAGS,
+            )
         return completed.returncode, completed.stdout.strip(), completed.stderr.strip()
     except (OSError, subprocess.SubprocessError):
         return None
@@ -4,12 +4,11 @@ Overlay dialog offering next-step actions for a notification.
 
 from __future__ import annotations
 
-from PySide6.QtCore import QPoint, Qt, Signal
-from PySide6.QtGui import QColor
+from collections import OrderedDict
+
+from PySide6.QtCore import QPoint, QSize, Qt, Signal
 from PySide6.QtWidgets import (
-    QApplication,
     QDialog,
-    QGraphicsDropShadowEffect,
     QHBoxLayout,
     QLabel,
     QPushButton,
@@ -17,8 +16,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from core.popup_style import install_popup_stylesheet
+from core.screen_geometry import available_geometry
 from shared.module_definition import ModuleDefinition
 
+_SIZE_HINT_CACHE_MAX_ENTRIES = 32
+
 
 class ModuleOverlay(QDialog):
     showMeHow = Signal()
@@ -27,6 +30,7 @@ class ModuleOverlay(QDialog):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        self.setObjectName("ModuleOverlay")
         flags = (
             Qt.WindowType.FramelessWindowHint
             | Qt.WindowType.Tool
@@ -34,16 +38,17 @@ class ModuleOverlay(QDialog):
         )
         self.setWindowFlags(flags)
         self.setWindowOpacity(0.95)
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(24)
-        shadow.setColor(QColor(0, 0, 0, 160))
-        shadow.setOffset(0, 12)
-        self.setGraphicsEffect(shadow)
 
         self._module: ModuleDefinition | None = None
+        self._size_hints: "OrderedDict[tuple[str, str], QSize]" = OrderedDict()
+        self._built = False
+
+    def _build_ui(self) -> None:
+        """Create the overlay's widget tree; deferred until the first present()."""
+        install_popup_stylesheet()
 
         self._title_label = QLabel()
-        self._title_label.setStyleSheet("font-weight: bold; font-size: 16px;")
+        self._title_label.setObjectName("OverlayTitle")
         self._message_label = QLabel()
         self._message_label.setWordWrap(True)
 
@@ -54,23 +59,6 @@ class ModuleOverlay(QDialog):
         for btn in (self._show_me_how_btn, self._understood_btn, self._remind_later_btn):
             btn.setMinimumHeight(34)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(
-                """
-                QPushButton {
-                    padding: 0 14px;
-                    border-radius: 10px;
-                    background-color: #2563eb;
-                    color: white;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: #1d4ed8;
-                }
-                QPushButton:pressed {
-                    background-color: #1e40af;
-                }
-                """
-            )
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -87,38 +75,55 @@ class ModuleOverlay(QDialog):
         button_row.addWidget(self._remind_later_btn)
         layout.addLayout(button_row)
 
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: #111827;
-                color: white;
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.08);
-            }
-            QLabel {
-                color: white;
-            }
-            """
-        )
-
-        self._show_me_how_btn.clicked.connect(self._emit_show_me_how)  # type: ignore[arg-type]
-        self._understood_btn.clicked.connect(self._emit_understood)  # type: ignore[arg-type]
-        self._remind_later_btn.clicked.connect(self._emit_remind_later)  # type: ignore[arg-type]
+        # Queue button actions so receivers run after the click handler returns.
+        queued = Qt.ConnectionType.QueuedConnection
+        self._show_me_how_btn.clicked.connect(self._emit_show_me_how, queued)  # type: ignore[arg-type]
+        self._understood_btn.clicked.connect(self._emit_understood, queued)  # type: ignore[arg-type]
+        self._remind_later_btn.clicked.connect(self._emit_remind_later, queued)  # type: ignore[arg-type]
 
     def present(self, module: ModuleDefinition) -> None:
         """Display the overlay for the provided module."""
+        if not self._built:
+            self._build_ui()
+            self._built = True
         self._module = module
-        self._title_label.setText(module.title)
-        self._message_label.setText(module.message)
-        self.adjustSize()
-        self._position_bottom_right()
+        # Batch the label and geometry updates into a single repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            if self._title_label.text() != module.title:
+                self._title_label.setText(module.title)
+            if self._message_label.text() != module.message:
+                self._message_label.setText(module.message)
+            self._resize_to_contents(module.title, module.message)
+            self._position_bottom_right()
+        finally:
+            self.setUpdatesEnabled(True)
         self.show()
 
+    def _resize_to_contents(self, title: str, message: str) -> None:
+        """Resize to the layout's size hint, reusing hints computed for the same text."""
+        key = (title, message)
+        hint = self._size_hints.get(key)
+        if hint is None:
+            self.ensurePolished()
+            self.layout().activate()
+            hint = self.sizeHint()
+            hint.setWidth(max(self.minimumWidth(), min(hint.width(), self.maximumWidth())))
+            if self.hasHeightForWidth():
+                height = self.heightForWidth(hint.width())
+                if height > 0:
+                    hint.setHeight(height)
+            self._size_hints[key] = QSize(hint)
+            if len(self._size_hints) > _SIZE_HINT_CACHE_MAX_ENTRIES:
+                self._size_hints.popitem(last=False)
+        else:
+            self._size_hints.move_to_end(key)
+        self.resize(hint)
+
     def _position_bottom_right(self) -> None:
-        screen = QApplication.primaryScreen()
-        if screen is None:
+        geometry = available_geometry()
+        if geometry is None:
             return
-        geometry = screen.availableGeometry()
         x = geometry.right() - self.width() - 30
         y = geometry.bottom() - self.height() - 30
         self.move(QPoint(x, y))
@@ -4,13 +4,15 @@ Notification popup window presented in the bottom-right corner with action icons
 
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import QPoint, QSize, Qt, Signal
-from PySide6.QtGui import QMouseEvent, QPixmap, QColor
+from PySide6.QtCore import QMargins, QPoint, QSize, Qt, Signal
+from PySide6.QtGui import QMouseEvent, QPainter, QPixmap, QColor
 from PySide6.QtWidgets import (
     QApplication,
-    QGraphicsDropShadowEffect,
     QHBoxLayout,
     QLabel,
     QSizePolicy,
@@ -20,6 +22,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from core import icon_cache
+from core.popup_style import install_popup_stylesheet
+from core.screen_geometry import available_geometry
+from core.shadow import paint_shadow
 from shared.module_definition import ModuleDefinition
 
 ASSETS_DIR = Path(__file__).resolve().parent / "Assets"
@@ -27,6 +33,26 @@ IDEA_ICON_PATH = ASSETS_DIR / "idea.png"
 BUILDER_IDEA_ICON_PATH = (
     Path(__file__).resolve().parents[2] / "windows_notifier_builder" / "windows_notifier_builder" / "Assets" / "idea.png"
 )
+# Resolved once at import: the bundled asset wins, then the builder's copy when run from source.
+_IDEA_SOURCE: Path | None = next((path for path in (IDEA_ICON_PATH, BUILDER_IDEA_ICON_PATH) if path.exists()), None)
+ICON_SIZE = 48
+_SHADOW_BLUR_RADIUS = 24
+_SHADOW_OFFSET_Y = 10
+_SHADOW_COLOR = QColor(0, 0, 0, 140)
+_CARD_CORNER_RADIUS = 12
+_SHADOW_MARGINS = QMargins(
+    _SHADOW_BLUR_RADIUS,
+    max(_SHADOW_BLUR_RADIUS - _SHADOW_OFFSET_Y, 0),
+    _SHADOW_BLUR_RADIUS,
+    _SHADOW_BLUR_RADIUS + _SHADOW_OFFSET_Y,
+)
+_SIZE_HINT_CACHE_MAX_ENTRIES = 32
+_PRESET_ICONS = {
+    "info": QStyle.StandardPixmap.SP_MessageBoxInformation,
+    "warning": QStyle.StandardPixmap.SP_MessageBoxWarning,
+    "reminder": QStyle.StandardPixmap.SP_BrowserReload,
+    "idea": QStyle.StandardPixmap.SP_FileDialogDetailedView,
+}
 
 
 class NotificationPopup(QWidget):
@@ -39,6 +65,7 @@ class NotificationPopup(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         flags = Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint
         super().__init__(parent)
+        install_popup_stylesheet()
         self.setWindowFlags(flags)
         self.setWindowFlag(Qt.WindowType.ToolTip, False)
         self.setObjectName("NotificationPopup")
@@ -47,25 +74,20 @@ class NotificationPopup(QWidget):
 
         self._container = QWidget(self)
         self._container.setObjectName("PopupCard")
-        shadow = QGraphicsDropShadowEffect(self._container)
-        shadow.setBlurRadius(24)
-        shadow.setColor(QColor(0, 0, 0, 140))
-        shadow.setOffset(0, 10)
-        self._container.setGraphicsEffect(shadow)
 
         self._module: ModuleDefinition | None = None
+        self._size_hints: "OrderedDict[tuple[str, str], QSize]" = OrderedDict()
 
         self._icon_label = QLabel()
         self._icon_label.setFixedSize(48, 48)
         self._icon_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
-        icon = self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation)
-        self._default_pixmap = icon.pixmap(48, 48)
+        self._default_pixmap = icon_cache.standard_pixmap(QStyle.StandardPixmap.SP_MessageBoxInformation, ICON_SIZE)
         self._icon_label.setPixmap(self._default_pixmap)
+        self._current_icon_key: tuple | None = ("default",)
 
         self._title_label = QLabel()
         self._title_label.setObjectName("NotificationTitle")
-        self._title_label.setStyleSheet("font-weight: bold; font-size: 14px;")
 
         self._message_label = QLabel()
         self._message_label.setWordWrap(True)
@@ -97,7 +119,8 @@ class NotificationPopup(QWidget):
         text_layout.addWidget(actions_row)
 
         base_layout = QHBoxLayout(self)
-        base_layout.setContentsMargins(0, 0, 0, 0)
+        # Leave transparent room around the card for the painted shadow.
+        base_layout.setContentsMargins(_SHADOW_MARGINS)
         base_layout.addWidget(self._container)
 
         layout = QHBoxLayout(self._container)
@@ -105,118 +128,113 @@ class NotificationPopup(QWidget):
         layout.addLayout(text_layout)
         layout.setContentsMargins(12, 10, 12, 12)
         layout.setSpacing(10)
-        self.setMinimumWidth(340)
-        self.setMaximumWidth(460)
-
-        self.setStyleSheet(
-            """
-            QWidget#PopupCard {
-                background-color: rgba(24, 24, 28, 0.78);
-                color: white;
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.10);
-            }
-            QWidget#PopupCard QLabel#NotificationTitle {
-                color: white;
-            }
-            QWidget#PopupCard QLabel#NotificationMessage {
-                color: rgba(255, 255, 255, 0.85);
-                margin-top: 2px;
-            }
-            """
-        )
+        shadow_width = _SHADOW_MARGINS.left() + _SHADOW_MARGINS.right()
+        self.setMinimumWidth(340 + shadow_width)
+        self.setMaximumWidth(460 + shadow_width)
 
-        self._show_button.clicked.connect(self.showMeHow)  # type: ignore[arg-type]
-        self._understand_button.clicked.connect(self.understood)  # type: ignore[arg-type]
-        self._remind_button.clicked.connect(self.remindLater)  # type: ignore[arg-type]
+        # Queue button actions so receivers run after the click handler returns.
+        queued = Qt.ConnectionType.QueuedConnection
+        self._show_button.clicked.connect(self.showMeHow, queued)  # type: ignore[arg-type]
+        self._understand_button.clicked.connect(self.understood, queued)  # type: ignore[arg-type]
+        self._remind_button.clicked.connect(self.remindLater, queued)  # type: ignore[arg-type]
 
     def _create_action_button(self, standard_icon: QStyle.StandardPixmap, tooltip: str) -> QToolButton:
         button = QToolButton()
+        button.setObjectName("ActionButton")
         button.setAutoRaise(False)
         button.setCursor(Qt.CursorShape.PointingHandCursor)
         button.setToolTip(tooltip)
         button.setIconSize(QSize(26, 26))
         button.setFixedSize(44, 44)
-        button.setIcon(self.style().standardIcon(standard_icon))
-        button.setStyleSheet(
-            """
-            QToolButton {
-                background-color: rgba(255, 255, 255, 0.12);
-                border-radius: 21px;
-            }
-            QToolButton:hover {
-                background-color: rgba(255, 255, 255, 0.22);
-            }
-            QToolButton:pressed {
-                background-color: rgba(255, 255, 255, 0.30);
-            }
-            """
-        )
+        button.setIcon(icon_cache.standard_icon(standard_icon))
         return button
 
     def show_for(self, module: ModuleDefinition) -> None:
         """Populate the popup with module data and display it."""
         self._module = module
-        self._title_label.setText(module.title)
-        self._message_label.setText(module.message)
-        self._apply_icon(module)
-        self.adjustSize()
-        self._position_bottom_right()
+        # Batch the label, icon, and geometry updates into a single repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            if self._title_label.text() != module.title:
+                self._title_label.setText(module.title)
+            if self._message_label.text() != module.message:
+                self._message_label.setText(module.message)
+            self._apply_icon(module)
+            self._resize_to_contents(module.title, module.message)
+            self._position_bottom_right()
+        finally:
+            self.setUpdatesEnabled(True)
         self.show()
 
+    @staticmethod
+    def _get_preset_pixmap(preset: str) -> QPixmap:
+        # Both sources are already cached: the bundled idea asset by _scaled_pixmap,
+        # standard icons by icon_cache.
+        if preset == "idea" and _IDEA_SOURCE is not None:
+            pixmap = _scaled_pixmap(str(_IDEA_SOURCE), ICON_SIZE, None)
+            if not pixmap.isNull():
+                return pixmap
+        standard_icon = _PRESET_ICONS.get(preset, QStyle.StandardPixmap.SP_MessageBoxInformation)
+        return icon_cache.standard_pixmap(standard_icon, ICON_SIZE)
+
+    def _resize_to_contents(self, title: str, message: str) -> None:
+        """Resize to the layout's size hint, reusing hints computed for the same text."""
+        key = (title, message)
+        hint = self._size_hints.get(key)
+        if hint is None:
+            self.ensurePolished()
+            self.layout().activate()
+            hint = self.sizeHint()
+            hint.setWidth(max(self.minimumWidth(), min(hint.width(), self.maximumWidth())))
+            if self.hasHeightForWidth():
+                height = self.heightForWidth(hint.width())
+                if height > 0:
+                    hint.setHeight(height)
+            self._size_hints[key] = QSize(hint)
+            if len(self._size_hints) > _SIZE_HINT_CACHE_MAX_ENTRIES:
+                self._size_hints.popitem(last=False)
+        else:
+            self._size_hints.move_to_end(key)
+        self.resize(hint)
+
     def _apply_icon(self, module: ModuleDefinition) -> None:
-        pixmap: QPixmap | None = None
+        # Skip decoding and the label repaint when the same icon is already shown.
         if module.icon_preset:
-            if module.icon_preset == "idea":
-                idea_source = IDEA_ICON_PATH if IDEA_ICON_PATH.exists() else BUILDER_IDEA_ICON_PATH
-                idea_pixmap = QPixmap(str(idea_source)) if idea_source.exists() else QPixmap()
-                if not idea_pixmap.isNull():
-                    self._icon_label.setPixmap(
-                        idea_pixmap.scaled(
-                            48,
-                            48,
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation,
-                        )
-                    )
-                    return
-            preset_map = {
-                "info": QStyle.StandardPixmap.SP_MessageBoxInformation,
-                "warning": QStyle.StandardPixmap.SP_MessageBoxWarning,
-                "reminder": QStyle.StandardPixmap.SP_BrowserReload,
-                "idea": QStyle.StandardPixmap.SP_FileDialogDetailedView,
-            }
-            standard_icon = preset_map.get(module.icon_preset, QStyle.StandardPixmap.SP_MessageBoxInformation)
-            icon_pixmap = self.style().standardIcon(standard_icon).pixmap(48, 48)
-            self._icon_label.setPixmap(icon_pixmap)
-            return
-        if module.icon_path and module.icon_path.exists():
-            pixmap = QPixmap(str(module.icon_path))
+            key: tuple = ("preset", module.icon_preset)
+        elif module.icon_path and (version := _file_version(str(module.icon_path))) is not None:
+            key = ("path", str(module.icon_path), version)
         elif module.icon_url:
-            temp_pix = QPixmap()
-            if temp_pix.load(module.icon_url):
-                pixmap = temp_pix
-        if pixmap and not pixmap.isNull():
-            self._icon_label.setPixmap(
-                pixmap.scaled(
-                    48,
-                    48,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+            key = ("url", module.icon_url, _file_version(module.icon_url))
         else:
-            self._icon_label.setPixmap(self._default_pixmap)
+            key = ("default",)
+        if key == self._current_icon_key:
+            return
+
+        pixmap: QPixmap | None = None
+        if key[0] == "preset":
+            pixmap = self._get_preset_pixmap(module.icon_preset)
+        elif key[0] in ("path", "url"):
+            pixmap = _scaled_pixmap(key[1], ICON_SIZE, key[2])
+        if pixmap is None or pixmap.isNull():
+            pixmap = self._default_pixmap
+        self._icon_label.setPixmap(pixmap)
+        self._current_icon_key = key
 
     def _position_bottom_right(self) -> None:
-        screen = QApplication.primaryScreen()
-        if screen is None:
+        geometry = available_geometry()
+        if geometry is None:
             return
-        geometry = screen.availableGeometry()
-        x = geometry.right() - self.width() - 20
-        y = geometry.bottom() - self.height() - 20
+        # Keep the card itself 20px from the screen edge; the shadow margin may overhang.
+        x = geometry.right() - self.width() - 20 + _SHADOW_MARGINS.right()
+        y = geometry.bottom() - self.height() - 20 + _SHADOW_MARGINS.bottom()
         self.move(QPoint(x, y))
 
+    def paintEvent(self, event) -> None:  # noqa: N802
+        painter = QPainter(self)
+        card_rect = self._container.geometry().translated(0, _SHADOW_OFFSET_Y)
+        paint_shadow(painter, card_rect, _SHADOW_BLUR_RADIUS, _SHADOW_COLOR, _CARD_CORNER_RADIUS)
+        painter.end()
+
     def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
         super().mousePressEvent(event)
         if event.button() == Qt.MouseButton.LeftButton:
@@ -226,3 +244,44 @@ class NotificationPopup(QWidget):
         self.closed.emit()
         super().closeEvent(event)
 
+
+_popup_singleton: NotificationPopup | None = None
+_popup_app: QApplication | None = None
+
+
+def get_notification_popup() -> NotificationPopup:
+    """
+    Return the tray app's popup, constructing it on first use.
+
+    The popup is hidden rather than destroyed between notifications and is
+    reused across coordinator restarts. A new instance is created when the
+    QApplication has been replaced. Other windows (such as the builder
+    preview) should own a separate NotificationPopup.
+    """
+    global _popup_singleton, _popup_app
+    app = QApplication.instance()
+    if _popup_singleton is None or _popup_app is not app:
+        _popup_singleton = NotificationPopup()
+        _popup_app = app
+    return _popup_singleton
+
+
+def _file_version(source: str) -> int | None:
+    """Return the modification time of ``source``, or None if it cannot be read."""
+    try:
+        return os.stat(source).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _scaled_pixmap(source: str, size: int, version: int | None) -> QPixmap:
+    pixmap = QPixmap()
+    if not pixmap.load(source):
+        return QPixmap()
+    return pixmap.scaled(
+        size,
+        size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
@@ -0,0 +1,77 @@
+"""
+Application-wide stylesheet for the notification popup and module overlay.
+
+The rules are scoped by object name and installed on the QApplication once, so
+Qt parses them a single time instead of once per widget instance.
+"""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QApplication
+
+POPUP_QSS = """
+QWidget#PopupCard {
+    background-color: rgba(24, 24, 28, 0.78);
+    color: white;
+    border-radius: 12px;
+    border: 1px solid rgba(255, 255, 255, 0.10);
+}
+QLabel#NotificationTitle {
+    font-weight: bold;
+    font-size: 14px;
+}
+QWidget#PopupCard QLabel#NotificationTitle {
+    color: white;
+}
+QWidget#PopupCard QLabel#NotificationMessage {
+    color: rgba(255, 255, 255, 0.85);
+    margin-top: 2px;
+}
+QToolButton#ActionButton {
+    background-color: rgba(255, 255, 255, 0.12);
+    border-radius: 21px;
+}
+QToolButton#ActionButton:hover {
+    background-color: rgba(255, 255, 255, 0.22);
+}
+QToolButton#ActionButton:pressed {
+    background-color: rgba(255, 255, 255, 0.30);
+}
+QDialog#ModuleOverlay {
+    background-color: #111827;
+    color: white;
+    border-radius: 12px;
+    border: 1px solid rgba(255, 255, 255, 0.08);
+}
+QDialog#ModuleOverlay QLabel {
+    color: white;
+}
+QDialog#ModuleOverlay QLabel#OverlayTitle {
+    font-weight: bold;
+    font-size: 16px;
+}
+QDialog#ModuleOverlay QPushButton {
+    padding: 0 14px;
+    border-radius: 10px;
+    background-color: #2563eb;
+    color: white;
+    font-weight: 600;
+}
+QDialog#ModuleOverlay QPushButton:hover {
+    background-color: #1d4ed8;
+}
+QDialog#ModuleOverlay QPushButton:pressed {
+    background-color: #1e40af;
+}
+"""
+
+_INSTALLED_PROPERTY = "windowsNotifierPopupQss"
+
+
+def install_popup_stylesheet() -> None:
+    """Append POPUP_QSS to the running application's stylesheet if not already present."""
+    app = QApplication.instance()
+    if app is None or app.property(_INSTALLED_PROPERTY):
+        return
+    app.setStyleSheet(app.styleSheet() + POPUP_QSS)
+    app.setProperty(_INSTALLED_PROPERTY, True)
@@ -0,0 +1,82 @@
+"""
+Blocking registry change notification using Win32 RegNotifyChangeKeyValue.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from ctypes import wintypes
+from typing import Optional
+
+_KEY_NOTIFY = 0x0010
+_REG_NOTIFY_CHANGE_NAME = 0x00000001
+_REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+_WAIT_OBJECT_0 = 0x00000000
+_INFINITE = 0xFFFFFFFF
+
+
+class KeyChangeNotifier:
+    """
+    Owns a registry key handle opened for notification plus the events used to
+    wait on it.
+
+    ``wait`` blocks the calling thread until a value or subkey under the key
+    changes (returning True) or until ``stop`` is called from another thread
+    (returning False). Call ``close`` once the waiting thread has finished.
+    """
+
+    def __init__(self, advapi32, kernel32, key: wintypes.HKEY, change_event: int, stop_event: int) -> None:
+        self._advapi32 = advapi32
+        self._kernel32 = kernel32
+        self._key = key
+        self._change_event = change_event
+        self._stop_event = stop_event
+        self._handles = (wintypes.HANDLE * 2)(change_event, stop_event)
+
+    @classmethod
+    def open(cls, hive: int, subkey: str) -> Optional["KeyChangeNotifier"]:
+        """Open ``subkey`` for notification, or return None if unavailable."""
+        try:
+            advapi32 = ctypes.WinDLL("advapi32")  # type: ignore[attr-defined]
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+        except (AttributeError, OSError):
+            return None
+
+        key = wintypes.HKEY()
+        status = advapi32.RegOpenKeyExW(wintypes.HKEY(hive), subkey, 0, _KEY_NOTIFY, ctypes.byref(key))
+        if status != 0:
+            return None
+
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        change_event = kernel32.CreateEventW(None, False, False, None)
+        stop_event = kernel32.CreateEventW(None, True, False, None)
+        if not change_event or not stop_event:
+            for handle in (change_event, stop_event):
+                if handle:
+                    kernel32.CloseHandle(wintypes.HANDLE(handle))
+            advapi32.RegCloseKey(key)
+            return None
+
+        return cls(advapi32, kernel32, key, change_event, stop_event)
+
+    def wait(self) -> bool:
+        # The registration is one-shot, so re-arm it before every wait.
+        status = self._advapi32.RegNotifyChangeKeyValue(
+            self._key,
+            True,
+            _REG_NOTIFY_CHANGE_NAME | _REG_NOTIFY_CHANGE_LAST_SET,
+            wintypes.HANDLE(self._change_event),
+            True,
+        )
+        if status != 0:
+            return False
+        result = self._kernel32.WaitForMultipleObjects(2, self._handles, False, _INFINITE)
+        return result == _WAIT_OBJECT_0
+
+    def stop(self) -> None:
+        self._kernel32.SetEvent(wintypes.HANDLE(self._stop_event))
+
+    def close(self) -> None:
+        self._kernel32.CloseHandle(wintypes.HANDLE(self._change_event))
+        self._kernel32.CloseHandle(wintypes.HANDLE(self._stop_event))
+        self._advapi32.RegCloseKey(self._key)
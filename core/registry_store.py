@@ -4,14 +4,26 @@ Persistence layer for module state using the Windows registry.
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Iterator, Optional
+from typing import Callable, Iterator, Optional, TypeVar
 
 import winreg
 
+from core.registry_notify import KeyChangeNotifier
+from core.registry_transaction import RegistryTransaction
+from shared.manifest_schema import parse_utc_z_timestamp
+
+_WATCH_RETRY_SECONDS = 60
+_HANDLE_CACHE_MAX_ENTRIES = 64
+
+_T = TypeVar("_T")
+
 
 class ModuleStatus(Enum):
     PENDING = "Pending"
@@ -25,64 +37,115 @@ class ConditionState(Enum):
     ERROR = "Error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ModuleSnapshot:
+    """All tracked registry values for one module, read in a single key open."""
+
+    status: Optional[ModuleStatus] = None
+    module_hash: Optional[str] = None
+    schedule: Optional[str] = None
+    condition_state: Optional[ConditionState] = None
+    condition_next_run: Optional[datetime] = None
+    condition_error: Optional[str] = None
+
+
+class _CachedHandle:
+    """An open key handle plus the number of callers currently using it."""
+
+    __slots__ = ("cache_key", "key", "users", "retired")
+
+    def __init__(self, cache_key: tuple[str, bool], key) -> None:
+        self.cache_key = cache_key
+        self.key = key
+        self.users = 0
+        # Set once the handle leaves the cache; the last user then closes it.
+        self.retired = False
+
+
 class RegistryStore:
-    """Thin wrapper over winreg enabling consistent storage of module state."""
+    """
+    Thin wrapper over winreg enabling consistent storage of module state.
+
+    When the base key can be watched for changes, module snapshots are cached
+    in-process. The cache is cleared whenever the registry reports a change
+    under the base key, and the entry for a module is dropped after each
+    write made through this store.
+    """
 
     base_subkey: str = r"Software\WindowsNotifier\Modules"
-    hive: int = winreg.HKEY_CURRENT_USER
-    _winreg = winreg
+
+    __slots__ = (
+        "hive",
+        "_winreg",
+        "_cache",
+        "_cache_lock",
+        "_cache_generation",
+        "_notifier",
+        "_next_watch_attempt",
+        "_handle_cache",
+        "_handle_lock",
+        # Qt holds bound methods such as ``close`` weakly when they are connected to signals.
+        "__weakref__",
+    )
 
     def __init__(self, *, hive: Optional[int] = None, winreg_module=winreg) -> None:
-        if hive is not None:
-            self.hive = hive
+        self.hive = winreg.HKEY_CURRENT_USER if hive is None else hive
         self._winreg = winreg_module
+        self._cache: dict[str, ModuleSnapshot] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        self._notifier: Optional[KeyChangeNotifier] = None
+        self._next_watch_attempt = 0.0
+        # (key_name, writable) -> open key handle, least recently used first.
+        self._handle_cache: "OrderedDict[tuple[str, bool], _CachedHandle]" = OrderedDict()
+        self._handle_lock = threading.Lock()
 
     def get_status(self, key_name: str) -> Optional[ModuleStatus]:
+        if self._ensure_watching():
+            return self.snapshot(key_name).status
         try:
-            with self._open_key(key_name, writable=False) as key:
-                value, _ = self._winreg.QueryValueEx(key, "Status")
-        except (FileNotFoundError, OSError):
-            return None
-
-        try:
-            return ModuleStatus(value)
-        except ValueError:
+            value = self._read(key_name, lambda key: self._winreg.QueryValueEx(key, "Status")[0])
+        except OSError:
             return None
+        return _parse_status(value)
 
     def get_module_hash(self, key_name: str) -> Optional[str]:
+        if self._ensure_watching():
+            return self.snapshot(key_name).module_hash
         try:
-            with self._open_key(key_name, writable=False) as key:
-                value, _ = self._winreg.QueryValueEx(key, "ModuleHash")
-                return value
-        except (FileNotFoundError, OSError):
+            return self._read(key_name, lambda key: self._winreg.QueryValueEx(key, "ModuleHash")[0])
+        except OSError:
             return None
 
     def set_module_hash(self, key_name: str, module_hash: str) -> None:
-        with self._open_key(key_name, writable=True) as key:
+        def write(key) -> None:
             self._winreg.SetValueEx(key, "ModuleHash", 0, self._winreg.REG_SZ, module_hash)
 
+        self._write(key_name, write)
+
     def get_schedule(self, key_name: str) -> Optional[str]:
+        if self._ensure_watching():
+            return self.snapshot(key_name).schedule
         try:
-            with self._open_key(key_name, writable=False) as key:
-                value, _ = self._winreg.QueryValueEx(key, "ScheduledAt")
-                return value
-        except (FileNotFoundError, OSError):
+            return self._read(key_name, lambda key: self._winreg.QueryValueEx(key, "ScheduledAt")[0])
+        except OSError:
             return None
 
     def set_schedule(self, key_name: str, schedule: Optional[datetime]) -> None:
-        with self._open_key(key_name, writable=True) as key:
+        def write(key) -> None:
             if schedule is None:
                 try:
                     self._winreg.DeleteValue(key, "ScheduledAt")
                 except OSError:
                     pass
             else:
-                iso_value = schedule.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+                iso_value = _to_iso_z(schedule)
                 self._winreg.SetValueEx(key, "ScheduledAt", 0, self._winreg.REG_SZ, iso_value)
 
+        self._write(key_name, write)
+
     def mark_first_seen(self, key_name: str, *, title: Optional[str], category: Optional[str]) -> None:
-        with self._open_key(key_name, writable=True) as key:
+        def write(key) -> None:
             now_iso = _utcnow_iso()
             if not self._query_optional(key, "FirstSeen"):
                 self._winreg.SetValueEx(key, "FirstSeen", 0, self._winreg.REG_SZ, now_iso)
@@ -99,85 +162,345 @@ class RegistryStore:
             except OSError:
                 pass
 
+        self._write_transacted(key_name, write)
+
     def mark_completed(self, key_name: str) -> None:
-        with self._open_key(key_name, writable=True) as key:
+        def write(key) -> None:
             self._winreg.SetValueEx(key, "Status", 0, self._winreg.REG_SZ, ModuleStatus.COMPLETED.value)
             self._winreg.SetValueEx(key, "CompletedOn", 0, self._winreg.REG_SZ, _utcnow_iso())
 
+        self._write(key_name, write)
+
     def mark_expired(self, key_name: str) -> None:
-        with self._open_key(key_name, writable=True) as key:
+        def write(key) -> None:
             self._winreg.SetValueEx(key, "Status", 0, self._winreg.REG_SZ, ModuleStatus.EXPIRED.value)
 
+        self._write(key_name, write)
+
     def get_condition_state(self, key_name: str) -> Optional[ConditionState]:
+        if self._ensure_watching():
+            return self.snapshot(key_name).condition_state
         try:
-            with self._open_key(key_name, writable=False) as key:
-                value, _ = self._winreg.QueryValueEx(key, "ConditionState")
-        except (FileNotFoundError, OSError):
-            return None
-        try:
-            return ConditionState(value)
-        except ValueError:
+            value = self._read(key_name, lambda key: self._winreg.QueryValueEx(key, "ConditionState")[0])
+        except OSError:
             return None
+        return _parse_condition_state(value)
 
     def set_condition_state(self, key_name: str, state: ConditionState) -> None:
-        with self._open_key(key_name, writable=True) as key:
+        def write(key) -> None:
             self._winreg.SetValueEx(key, "ConditionState", 0, self._winreg.REG_SZ, state.value)
 
+        self._write(key_name, write)
+
     def clear_condition_tracking(self, key_name: str) -> None:
-        with self._open_key(key_name, writable=True) as key:
+        def write(key) -> None:
             for name in ("ConditionState", "ConditionNextRun", "ConditionError"):
                 try:
                     self._winreg.DeleteValue(key, name)
                 except OSError:
                     pass
 
+        self._write(key_name, write)
+
     def get_condition_next_run(self, key_name: str) -> Optional[datetime]:
+        if self._ensure_watching():
+            return self.snapshot(key_name).condition_next_run
         try:
-            with self._open_key(key_name, writable=False) as key:
-                value, _ = self._winreg.QueryValueEx(key, "ConditionNextRun")
-        except (FileNotFoundError, OSError):
-            return None
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
+            value = self._read(key_name, lambda key: self._winreg.QueryValueEx(key, "ConditionNextRun")[0])
+        except OSError:
             return None
+        return _parse_iso_datetime(value)
 
     def set_condition_next_run(self, key_name: str, when: datetime) -> None:
-        with self._open_key(key_name, writable=True) as key:
-            iso_value = when.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        def write(key) -> None:
+            iso_value = _to_iso_z(when)
             self._winreg.SetValueEx(key, "ConditionNextRun", 0, self._winreg.REG_SZ, iso_value)
 
+        self._write(key_name, write)
+
     def set_condition_error(self, key_name: str, message: str) -> None:
-        with self._open_key(key_name, writable=True) as key:
+        def write(key) -> None:
             self._winreg.SetValueEx(key, "ConditionError", 0, self._winreg.REG_SZ, message[:1024])
             self._winreg.SetValueEx(key, "ConditionState", 0, self._winreg.REG_SZ, ConditionState.ERROR.value)
 
+        self._write(key_name, write)
+
+    def snapshot(self, key_name: str) -> ModuleSnapshot:
+        """Return every tracked value for a module, read with one key open."""
+        if not self._ensure_watching():
+            return self._read_snapshot(key_name)
+
+        with self._cache_lock:
+            cached = self._cache.get(key_name)
+            generation = self._cache_generation
+        if cached is not None:
+            return cached
+
+        snapshot = self._read_snapshot(key_name)
+        with self._cache_lock:
+            # Skip storing if the registry changed while the values were being read.
+            if generation == self._cache_generation:
+                self._cache[key_name] = snapshot
+        return snapshot
+
+    def _read_snapshot(self, key_name: str) -> ModuleSnapshot:
+        def read(key) -> ModuleSnapshot:
+            status = self._query_optional(key, "Status")
+            condition_state = self._query_optional(key, "ConditionState")
+            condition_next_run = self._query_optional(key, "ConditionNextRun")
+            return ModuleSnapshot(
+                status=_parse_status(status) if status is not None else None,
+                module_hash=self._query_optional(key, "ModuleHash"),
+                schedule=self._query_optional(key, "ScheduledAt"),
+                condition_state=(
+                    _parse_condition_state(condition_state) if condition_state is not None else None
+                ),
+                condition_next_run=(
+                    _parse_iso_datetime(condition_next_run) if condition_next_run is not None else None
+                ),
+                condition_error=self._query_optional(key, "ConditionError"),
+            )
+
+        try:
+            return self._read(key_name, read)
+        except OSError:
+            return ModuleSnapshot()
+
     @contextmanager
     def _open_key(self, key_name: str, *, writable: bool) -> Iterator:
-        subkey = f"{self.base_subkey}\\{key_name}"
-        access = self._winreg.KEY_READ
-        if writable:
-            access |= self._winreg.KEY_WRITE
+        # The lock only guards the cache; it is not held while the key is used.
+        handle = self._checkout(key_name, writable=writable)
+        try:
+            yield handle.key
+        except FileNotFoundError:
+            # A missing value, not a bad handle.
+            raise
+        except OSError:
+            # The key may have been deleted externally; reopen it next time.
+            self._evict(handle)
+            raise
+        finally:
+            self._checkin(handle)
+            if writable:
+                self._invalidate(key_name)
 
+    def _read(self, key_name: str, read: Callable[[object], _T]) -> _T:
+        """
+        Return ``read`` applied to a readable handle for ``key_name``.
+
+        Like ``_write``, a read through a stale cached handle evicts it and is
+        retried once against a freshly opened key.
+        """
         try:
-            key = self._winreg.OpenKey(self.hive, subkey, 0, access)
+            with self._open_key(key_name, writable=False) as key:
+                return read(key)
         except FileNotFoundError:
-            if not writable:
-                raise
-            key = self._winreg.CreateKey(self.hive, subkey)
+            raise
+        except OSError:
+            with self._open_key(key_name, writable=False) as key:
+                return read(key)
+
+    def _write(self, key_name: str, write: Callable[[object], None]) -> None:
+        """
+        Run ``write`` against a writable handle for ``key_name``.
+
+        A cached handle goes stale when the key is deleted externally, and its
+        first write then fails; the handle is evicted and ``write`` is retried
+        once against a freshly created key.
+        """
         try:
-            yield key
+            with self._open_key(key_name, writable=True) as key:
+                write(key)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            with self._open_key(key_name, writable=True) as key:
+                write(key)
+
+    def _write_transacted(self, key_name: str, write: Callable[[object], None]) -> None:
+        """
+        Run ``write`` against a key whose writes are committed together.
+
+        Only mark_first_seen uses this: it resets a module's whole record,
+        which should never be seen half-applied. One- and two-value updates
+        use ``_write``, which needs fewer calls. Falls back to ``_write`` when
+        KTM is unavailable.
+        """
+        transaction = RegistryTransaction.begin() if self._winreg is winreg else None
+        key = None
+        if transaction is not None:
+            key = transaction.create_key(self.hive, f"{self.base_subkey}\\{key_name}")
+            if key is None:
+                transaction.close()
+        if key is None:
+            self._write(key_name, write)
+            return
+
+        try:
+            write(key)
+            transaction.commit()
         finally:
-            self._winreg.CloseKey(key)
+            transaction.close()
+            self._invalidate(key_name)
+
+    def _checkout(self, key_name: str, *, writable: bool) -> "_CachedHandle":
+        with self._handle_lock:
+            cache_key = (key_name, True)
+            handle = self._handle_cache.get(cache_key)
+            if handle is None and not writable:
+                cache_key = (key_name, False)
+                handle = self._handle_cache.get(cache_key)
+
+            if handle is None:
+                handle = _CachedHandle(cache_key, self._open_handle(key_name, writable=writable))
+                self._handle_cache[cache_key] = handle
+                if writable:
+                    # A read-write handle serves reads too, so drop any read-only one.
+                    stale = self._handle_cache.pop((key_name, False), None)
+                    if stale is not None:
+                        self._retire(stale)
+                while len(self._handle_cache) > _HANDLE_CACHE_MAX_ENTRIES:
+                    _, evicted = self._handle_cache.popitem(last=False)
+                    self._retire(evicted)
+            self._handle_cache.move_to_end(cache_key)
+            handle.users += 1
+            return handle
+
+    def _checkin(self, handle: "_CachedHandle") -> None:
+        with self._handle_lock:
+            handle.users -= 1
+            if handle.retired and handle.users == 0:
+                self._winreg.CloseKey(handle.key)
+
+    def _evict(self, handle: "_CachedHandle") -> None:
+        with self._handle_lock:
+            if self._handle_cache.get(handle.cache_key) is handle:
+                del self._handle_cache[handle.cache_key]
+                self._retire(handle)
+
+    def _retire(self, handle: "_CachedHandle") -> None:
+        """Close ``handle`` once no caller is using it; call with the handle lock held."""
+        handle.retired = True
+        if handle.users == 0:
+            self._winreg.CloseKey(handle.key)
+
+    def _open_handle(self, key_name: str, *, writable: bool):
+        subkey = f"{self.base_subkey}\\{key_name}"
+        access = self._winreg.KEY_READ
+        if writable:
+            access |= self._winreg.KEY_WRITE
+
+        if writable:
+            # Opens the key, or recreates it if it was deleted.
+            return self._winreg.CreateKeyEx(self.hive, subkey, 0, access)
+        return self._winreg.OpenKey(self.hive, subkey, 0, access)
+
+    def close(self) -> None:
+        """
+        Stop watching for registry changes and close cached key handles.
+
+        The store stays usable: later calls reopen keys and read uncached.
+        """
+        notifier = self._notifier
+        if notifier is not None:
+            self._next_watch_attempt = float("inf")
+            notifier.stop()
+        with self._handle_lock:
+            while self._handle_cache:
+                _, handle = self._handle_cache.popitem()
+                self._retire(handle)
+
+    def _invalidate(self, key_name: Optional[str] = None) -> None:
+        with self._cache_lock:
+            if key_name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key_name, None)
+            self._cache_generation += 1
+
+    def _ensure_watching(self) -> bool:
+        """Start the change-notification thread if possible; True while it runs."""
+        if self._notifier is not None:
+            return True
+        if self._winreg is not winreg:
+            # Injected registry modules cannot be watched, so never cache for them.
+            return False
+        now = time.monotonic()
+        if now < self._next_watch_attempt:
+            return False
+        self._next_watch_attempt = now + _WATCH_RETRY_SECONDS
+
+        notifier = KeyChangeNotifier.open(self.hive, self.base_subkey)
+        if notifier is None:
+            return False
+        self._invalidate()
+        self._notifier = notifier
+        threading.Thread(
+            target=self._watch_changes,
+            args=(notifier,),
+            name="registry-store-watcher",
+            daemon=True,
+        ).start()
+        return True
+
+    def _watch_changes(self, notifier: KeyChangeNotifier) -> None:
+        while notifier.wait():
+            self._invalidate()
+        self._notifier = None
+        self._invalidate()
+        notifier.close()
 
     def _query_optional(self, key, value_name: str) -> Optional[str]:
         try:
             value, _ = self._winreg.QueryValueEx(key, value_name)
             return value
-        except OSError:
+        except FileNotFoundError:
+            # Other errors mean the handle itself is bad; _open_key evicts it.
             return None
 
 
+_utcnow_iso_cache: tuple[int, str] = (-1, "")
+
+
 def _utcnow_iso() -> str:
     """Return a UTC ISO-8601 timestamp without microseconds."""
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    global _utcnow_iso_cache
+    second = int(time.time())
+    cached_second, cached_value = _utcnow_iso_cache
+    if second == cached_second:
+        return cached_value
+    value = _to_iso_z(datetime.fromtimestamp(second, tz=timezone.utc))
+    _utcnow_iso_cache = (second, value)
+    return value
+
+
+def _to_iso_z(value: datetime) -> str:
+    """Format a datetime as a UTC ISO-8601 timestamp without microseconds."""
+    if value.tzinfo is not timezone.utc:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_status(value) -> Optional[ModuleStatus]:
+    try:
+        return ModuleStatus(value)
+    except ValueError:
+        return None
+
+
+def _parse_condition_state(value) -> Optional[ConditionState]:
+    try:
+        return ConditionState(value)
+    except ValueError:
+        return None
+
+
+def _parse_iso_datetime(value) -> Optional[datetime]:
+    if isinstance(value, str):
+        fast = parse_utc_z_timestamp(value)
+        if fast is not None:
+            return fast
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
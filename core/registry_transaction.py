@@ -0,0 +1,77 @@
+"""
+Kernel transaction manager (KTM) wrapper for committing several registry writes at once.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from ctypes import wintypes
+from typing import Optional
+
+_KEY_READ = 0x20019
+_KEY_WRITE = 0x20006
+_REG_OPTION_NON_VOLATILE = 0x00000000
+_INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+
+class RegistryTransaction:
+    """
+    Owns a KTM transaction handle and the registry keys opened under it.
+
+    Writes made through ``create_key`` handles become visible together when
+    ``commit`` succeeds. Closing without committing rolls them back.
+    """
+
+    def __init__(self, advapi32, ktmw32, kernel32, handle: int) -> None:
+        self._advapi32 = advapi32
+        self._ktmw32 = ktmw32
+        self._kernel32 = kernel32
+        self._handle = handle
+        self._keys: list[wintypes.HKEY] = []
+
+    @classmethod
+    def begin(cls) -> Optional["RegistryTransaction"]:
+        """Start a transaction, or return None if KTM is unavailable."""
+        try:
+            advapi32 = ctypes.WinDLL("advapi32")  # type: ignore[attr-defined]
+            ktmw32 = ctypes.WinDLL("ktmw32", use_last_error=True)  # type: ignore[attr-defined]
+            kernel32 = ctypes.WinDLL("kernel32")  # type: ignore[attr-defined]
+        except (AttributeError, OSError):
+            return None
+
+        ktmw32.CreateTransaction.restype = wintypes.HANDLE
+        handle = ktmw32.CreateTransaction(None, None, 0, 0, 0, 0, None)
+        if not handle or handle == _INVALID_HANDLE_VALUE:
+            return None
+        return cls(advapi32, ktmw32, kernel32, handle)
+
+    def create_key(self, hive: int, subkey: str) -> Optional[int]:
+        """Open or create ``subkey`` for read/write inside the transaction."""
+        key = wintypes.HKEY()
+        status = self._advapi32.RegCreateKeyTransactedW(
+            wintypes.HKEY(hive),
+            subkey,
+            0,
+            None,
+            _REG_OPTION_NON_VOLATILE,
+            _KEY_READ | _KEY_WRITE,
+            None,
+            ctypes.byref(key),
+            None,
+            wintypes.HANDLE(self._handle),
+            None,
+        )
+        if status != 0:
+            return None
+        self._keys.append(key)
+        return key.value
+
+    def commit(self) -> None:
+        """Commit every write made under the transaction; raises OSError on failure."""
+        if not self._ktmw32.CommitTransaction(wintypes.HANDLE(self._handle)):
+            raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+
+    def close(self) -> None:
+        while self._keys:
+            self._advapi32.RegCloseKey(self._keys.pop())
+        self._kernel32.CloseHandle(wintypes.HANDLE(self._handle))
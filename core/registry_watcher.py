@@ -0,0 +1,54 @@
+"""
+Qt signal wrapper around registry change notification.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from core.registry_notify import KeyChangeNotifier
+
+
+class RegistryWatcher(QThread):
+    """
+    Waits on a registry key from a background thread and emits ``changed``
+    whenever a value under it is added, removed, or modified.
+
+    ``watch`` opens the key on the calling thread and reports whether
+    notification is available, so callers can fall back to polling when the
+    key is missing or the platform lacks the API.
+    """
+
+    changed = Signal()
+
+    def __init__(self, hive: int, subkey: str, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._hive = hive
+        self._subkey = subkey
+        self._notifier: Optional[KeyChangeNotifier] = None
+
+    def watch(self) -> bool:
+        """Open the key and start the watcher thread. Returns False if unavailable."""
+        if self.isRunning():
+            return True
+        self._notifier = KeyChangeNotifier.open(self._hive, self._subkey)
+        if self._notifier is None:
+            return False
+        self.start()
+        return True
+
+    def stop(self) -> None:
+        """Signal the watcher thread to exit and release its handles."""
+        notifier, self._notifier = self._notifier, None
+        if notifier is None:
+            return
+        notifier.stop()
+        self.wait()
+        notifier.close()
+
+    def run(self) -> None:
+        notifier = self._notifier
+        while notifier is not None and notifier.wait():
+            self.changed.emit()
@@ -0,0 +1,70 @@
+"""
+Cached primary-screen geometry shared by the popup windows.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QGuiApplication, QScreen
+
+
+class _ScreenGeometryCache:
+    """
+    Remembers the primary screen's available geometry until Qt reports that
+    the screen layout changed.
+    """
+
+    def __init__(self) -> None:
+        self._rect: Optional[QRect] = None
+        self._screen: Optional[QScreen] = None
+        self._app: Optional[QGuiApplication] = None
+
+    def available_geometry(self) -> Optional[QRect]:
+        app = QGuiApplication.instance()
+        if app is None:
+            return None
+        if app is not self._app:
+            # A fresh QApplication (e.g. after a crash-recovery restart) owns new screens.
+            app.screenAdded.connect(self.invalidate)
+            app.screenRemoved.connect(self._on_screen_removed)
+            app.primaryScreenChanged.connect(self.invalidate)
+            self._app = app
+            self._screen = None
+            self._rect = None
+
+        if self._rect is not None:
+            return QRect(self._rect)
+
+        screen = QGuiApplication.primaryScreen()
+        if screen is None:
+            return None
+        if screen is not self._screen:
+            if self._screen is not None:
+                try:
+                    self._screen.availableGeometryChanged.disconnect(self.invalidate)
+                except (RuntimeError, TypeError):
+                    pass
+            screen.availableGeometryChanged.connect(self.invalidate)
+            self._screen = screen
+
+        self._rect = screen.availableGeometry()
+        return QRect(self._rect)
+
+    def invalidate(self, *_args) -> None:
+        self._rect = None
+
+    def _on_screen_removed(self, screen: QScreen) -> None:
+        if screen is self._screen:
+            # The QScreen is about to be destroyed; drop it without disconnecting.
+            self._screen = None
+        self.invalidate()
+
+
+_CACHE = _ScreenGeometryCache()
+
+
+def available_geometry() -> Optional[QRect]:
+    """Return the primary screen's available geometry, or None without a screen."""
+    return _CACHE.available_geometry()
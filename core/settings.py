@@ -14,12 +14,12 @@ from windows_notifier_core.windows_notifier_core import logger as app_logger
 
 _LOGGER = app_logger.get_logger()
 
-_BASE_SUBKEY = r"Software\WindowsNotifier\Core"
+SETTINGS_SUBKEY = r"Software\WindowsNotifier\Core"
 _MIN_SCAN_INTERVAL = 60
 _MAX_SCAN_INTERVAL = 3600
 
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class CoreSettings:
     enabled: bool = True
     scan_interval_seconds: int = DEFAULT_SCAN_INTERVAL_SECONDS
@@ -29,13 +29,37 @@ class CoreSettings:
 
 
 class CoreSettingsManager:
-    """Loads persisted settings from HKCU and clamps invalid data."""
+    """
+    Loads persisted settings from HKCU and clamps invalid data.
+
+    The manager does not watch the registry itself. While the owner reports
+    that something is watching SETTINGS_SUBKEY (``set_change_tracking``), the
+    last result is reused until ``invalidate`` is called for a change.
+    """
 
     def __init__(self, *, hive: Optional[int] = None, winreg_module=winreg) -> None:
         self.hive = hive or winreg.HKEY_CURRENT_USER
         self._winreg = winreg_module
+        self._cached: Optional[CoreSettings] = None
+        self._tracking_changes = False
 
     def read_settings(self) -> CoreSettings:
+        if self._tracking_changes and self._cached is not None:
+            return self._cached
+        settings = self._read_settings_uncached()
+        self._cached = settings if self._tracking_changes else None
+        return settings
+
+    def set_change_tracking(self, enabled: bool) -> None:
+        """Enable result reuse while changes to SETTINGS_SUBKEY are being reported."""
+        self._tracking_changes = enabled
+        self._cached = None
+
+    def invalidate(self) -> None:
+        """Force the next read_settings call to go to the registry."""
+        self._cached = None
+
+    def _read_settings_uncached(self) -> CoreSettings:
         key = self._open_key()
         if key is None:
             return CoreSettings()
@@ -53,7 +77,7 @@ class CoreSettingsManager:
 
     def _open_key(self):
         try:
-            return self._winreg.OpenKey(self.hive, _BASE_SUBKEY, 0, self._winreg.KEY_READ)
+            return self._winreg.OpenKey(self.hive, SETTINGS_SUBKEY, 0, self._winreg.KEY_READ)
         except FileNotFoundError:
             return None
 
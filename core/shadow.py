@@ -0,0 +1,87 @@
+"""
+Pre-rendered drop shadows painted as nine-slice pixmaps.
+
+QGraphicsDropShadowEffect re-renders its widget offscreen and blurs it on
+every repaint. The shadow of a rounded card only depends on its blur radius,
+colour, and corner radius, so it is rendered once here and stretched around
+the card's rectangle when painting.
+"""
+
+from __future__ import annotations
+
+import math
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+
+_SHADOW_CACHE: dict[tuple[int, int, int], QPixmap] = {}
+
+
+def shadow_pixmap(blur_radius: int, color: QColor, corner_radius: int) -> QPixmap:
+    """
+    Return a square shadow tile for ``paint_shadow``.
+
+    Each corner slice spans ``blur_radius`` outside the card and
+    ``blur_radius + corner_radius`` inside it, far enough in for the blur to
+    reach full strength; the single centre row and column are stretched along
+    the card's edges.
+    """
+    key = (blur_radius, color.rgba(), corner_radius)
+    cached = _SHADOW_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    margin = _tile_margin(blur_radius, corner_radius)
+    size = 2 * margin + 1
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+
+    # Coverage of a Gaussian-blurred rounded corner, computed from its signed
+    # distance field. The centre row and column model the straight edges of an
+    # arbitrarily long card, so they are treated as infinitely far from a corner.
+    sigma = max(blur_radius / 2.0, 1.0)
+    corner_centre = blur_radius + corner_radius
+    offsets = [corner_centre - (i + 0.5) for i in range(margin)]
+    offsets = offsets + [-math.inf] + offsets[::-1]
+    for y, oy in enumerate(offsets):
+        for x, ox in enumerate(offsets):
+            distance = math.hypot(max(ox, 0.0), max(oy, 0.0)) + min(max(ox, oy), 0.0) - corner_radius
+            if math.isinf(distance):
+                coverage = 1.0
+            else:
+                coverage = 0.5 * math.erfc(distance / (sigma * math.sqrt(2.0)))
+            shade = QColor(color)
+            shade.setAlpha(int(round(color.alpha() * coverage)))
+            image.setPixelColor(x, y, shade)
+
+    pixmap = QPixmap.fromImage(image)
+    _SHADOW_CACHE[key] = pixmap
+    return pixmap
+
+
+def paint_shadow(painter: QPainter, card_rect: QRect, blur_radius: int, color: QColor, corner_radius: int) -> None:
+    """Paint the cached shadow for ``card_rect`` as nine stretched slices."""
+    pixmap = shadow_pixmap(blur_radius, color, corner_radius)
+    margin = _tile_margin(blur_radius, corner_radius)
+    target = card_rect.adjusted(-blur_radius, -blur_radius, blur_radius, blur_radius)
+    inner_width = max(target.width() - 2 * margin, 0)
+    inner_height = max(target.height() - 2 * margin, 0)
+
+    # (source offset, source length, target length) for each band of the tile.
+    columns = ((0, margin, margin), (margin, 1, inner_width), (margin + 1, margin, margin))
+    rows = ((0, margin, margin), (margin, 1, inner_height), (margin + 1, margin, margin))
+    y = target.top()
+    for source_y, source_height, target_height in rows:
+        x = target.left()
+        for source_x, source_width, target_width in columns:
+            if target_width and target_height:
+                painter.drawPixmap(
+                    QRect(x, y, target_width, target_height),
+                    pixmap,
+                    QRect(source_x, source_y, source_width, source_height),
+                )
+            x += target_width
+        y += target_height
+
+
+def _tile_margin(blur_radius: int, corner_radius: int) -> int:
+    return 2 * blur_radius + corner_radius
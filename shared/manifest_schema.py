@@ -6,10 +6,33 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+_MAX_TITLE_LENGTH = 120
+_MAX_MESSAGE_LENGTH = 240
+_DEFAULT_CATEGORY = "General"
+_ZERO_OFFSET = timedelta(0)
+_ALLOWED_TYPES = frozenset({"standard", "conditional"})
+_ALLOWED_SOUNDS = frozenset({"windows_default"})
+_DRIVE_SEPARATORS = frozenset({"/", "\\"})
+_SUPPORTED_ASSETS = (
+    "relative file path",
+    "preset:<name>",
+    "http:// or https:// URL",
+    "www. URL",
+    "UNC/share path (e.g. \\\\server\\share)",
+    "drive path (e.g. C:\\folder\\file)",
+)
+
 
 class ManifestValidationError(ValueError):
     """Raised when a manifest file is missing required data or is malformed."""
@@ -19,9 +42,9 @@ class ManifestValidationError(ValueError):
 class ManifestConstraints:
     """Schema constraints as simple dataclass constants."""
 
-    max_title_length: int = 120
-    max_message_length: int = 240
-    default_category: str = "General"
+    max_title_length: int = _MAX_TITLE_LENGTH
+    max_message_length: int = _MAX_MESSAGE_LENGTH
+    default_category: str = _DEFAULT_CATEGORY
 
 
 def load_and_validate_manifest(path: Path) -> Dict[str, Any]:
@@ -32,43 +55,79 @@ def load_and_validate_manifest(path: Path) -> Dict[str, Any]:
     expires field expressed as an ISO-8601 string in UTC (if provided).
     """
     try:
-        contents = path.read_text(encoding="utf-8")
+        # Bytes go straight to the JSON scanner without an intermediate str.
+        contents = path.read_bytes()
     except FileNotFoundError as exc:
         raise ManifestValidationError(f"Manifest file not found: {path}") from exc
     except OSError as exc:
         raise ManifestValidationError(f"Unable to read manifest: {path}") from exc
 
     try:
-        raw_manifest = json.loads(contents)
+        raw_manifest = _json_loads(contents)
     except json.JSONDecodeError as exc:
         raise ManifestValidationError(f"Manifest is not valid JSON: {exc}") from exc
+    except UnicodeDecodeError as exc:
+        raise ManifestValidationError(f"Manifest is not valid UTF-8: {exc}") from exc
+
+    return validate_manifest_dict(raw_manifest)
 
+
+def _json_loads(contents: bytes) -> Any:
+    """Parse ``contents`` with orjson when available, deferring to json wherever the two disagree."""
+    if orjson is None:
+        return json.loads(contents)
+    try:
+        value = orjson.loads(contents)
+    except orjson.JSONDecodeError:
+        # json also accepts NaN/Infinity, out-of-range floats and UTF-16/32 input;
+        # let it decide, and word the error, exactly as before.
+        return json.loads(contents)
+    if _has_wide_float(value):
+        # orjson reads integers beyond 64 bits as lossy floats; json keeps them exact.
+        return json.loads(contents)
+    return value
+
+
+def _has_wide_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return abs(value) >= 2.0**63
+    if isinstance(value, dict):
+        return any(_has_wide_float(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_has_wide_float(item) for item in value)
+    return False
+
+
+def validate_manifest_dict(raw_manifest: Any) -> Dict[str, Any]:
+    """
+    Validate an already-parsed manifest and return its normalized form.
+
+    Applies the same rules as ``load_and_validate_manifest`` without touching
+    the filesystem, for callers that build manifests in memory.
+    """
     if not isinstance(raw_manifest, dict):
         raise ManifestValidationError("Manifest root must be a JSON object.")
 
-    constraints = ManifestConstraints()
-
     title = _require_string(
         raw_manifest.get("title"),
         field="title",
-        max_length=constraints.max_title_length,
+        max_length=_MAX_TITLE_LENGTH,
         required=True,
     )
 
     message = _require_string(
         raw_manifest.get("message"),
         field="message",
-        max_length=240,
+        max_length=_MAX_MESSAGE_LENGTH,
         required=True,
     )
 
     category = raw_manifest.get("category")
     if category is None or (isinstance(category, str) and category.strip() == ""):
-        category = constraints.default_category
+        category = _DEFAULT_CATEGORY
     else:
         category = _require_string(category, field="category", required=False)
 
-    media = raw_manifest.get("media")
     media_value = _validate_optional_asset(raw_manifest.get("media"), field="media")
 
     expires_raw = raw_manifest.get("expires")
@@ -95,7 +154,7 @@ def load_and_validate_manifest(path: Path) -> Dict[str, Any]:
     notification_type = raw_manifest.get("type", "standard")
     notification_type = _require_string(notification_type, field="type", required=False) or "standard"
     notification_type = notification_type.lower()
-    if notification_type not in {"standard", "conditional"}:
+    if notification_type not in _ALLOWED_TYPES:
         raise ManifestValidationError("type must be either 'standard' or 'conditional'.")
 
     condition_script = None
@@ -121,6 +180,40 @@ def load_and_validate_manifest(path: Path) -> Dict[str, Any]:
     return normalized
 
 
+def parse_utc_z_timestamp(value: str) -> Optional[datetime]:
+    """
+    Fast path for the fixed ``YYYY-MM-DDTHH:MM:SSZ`` form this project writes.
+
+    Returns None for any other shape (or an out-of-range field) so callers can
+    fall back to the general ISO-8601 parser.
+    """
+    if (
+        len(value) != 20
+        or value[19] != "Z"
+        or value[4] != "-"
+        or value[7] != "-"
+        or value[10] != "T"
+        or value[13] != ":"
+        or value[16] != ":"
+    ):
+        return None
+    digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=timezone.utc,
+        )
+    except ValueError:
+        return None
+
+
 def parse_iso8601_utc(value: str) -> datetime:
     """
     Parse a subset of ISO-8601 formatted timestamps that must be UTC.
@@ -131,6 +224,10 @@ def parse_iso8601_utc(value: str) -> datetime:
     if not isinstance(value, str):
         raise ManifestValidationError("expires must be a string.")
 
+    fast = parse_utc_z_timestamp(value)
+    if fast is not None:
+        return fast
+
     cleaned = value.strip()
     try:
         if cleaned.endswith("Z"):
@@ -148,14 +245,17 @@ def parse_iso8601_utc(value: str) -> datetime:
     if offset != timezone.utc.utcoffset(None):
         raise ManifestValidationError("expires must be specified in UTC.")
 
-    dt_utc = dt.astimezone(timezone.utc)
-
-    return dt_utc
+    # The offset is already zero, so only the tzinfo object may need swapping.
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
 
 
 def _format_utc_iso(dt: datetime) -> str:
     """Return a canonical UTC ISO-8601 string with trailing 'Z'."""
-    return dt.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    if dt.tzinfo is not timezone.utc and dt.utcoffset() != _ZERO_OFFSET:
+        dt = dt.astimezone(timezone.utc)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
 
 
 def _require_string(
@@ -174,8 +274,9 @@ def _require_string(
     if not isinstance(value, str):
         raise ManifestValidationError(f"{field} must be a string.")
 
+    # str.strip returns the same object when there is nothing to strip.
     stripped = value.strip()
-    if required and stripped == "":
+    if required and not stripped:
         raise ManifestValidationError(f"{field} must be a non-empty string.")
 
     if max_length is not None and len(stripped) > max_length:
@@ -193,21 +294,23 @@ def _validate_optional_asset(value: Any, *, field: str) -> Optional[str]:
     if not asset:
         return None
 
-    if asset.startswith("preset:"):
-        return asset
-
-    lowered = asset.lower()
-    if lowered.startswith(("https://", "http://")):
-        return asset
-    if lowered.startswith("www."):
-        return "https://" + asset
-
-    if asset.startswith("\\\\"):
-        cleaned = asset.replace("/", "\\")
-        cleaned = cleaned.lstrip("\\")
-        return "\\\\" + cleaned
-
-    if asset.startswith("/"):
+    # Dispatch on the first character so most assets are matched by one prefix test.
+    first = asset[:1]
+    if first == "p":
+        if asset.startswith("preset:"):
+            return asset
+    elif first in ("h", "H"):
+        if asset[:8].lower().startswith(("https://", "http://")):
+            return asset
+    elif first in ("w", "W"):
+        if asset[:4].lower() == "www.":
+            return "https://" + asset
+    elif first == "\\":
+        if asset.startswith("\\\\"):
+            cleaned = asset.replace("/", "\\")
+            cleaned = cleaned.lstrip("\\")
+            return "\\\\" + cleaned
+    elif first == "/":
         raise ManifestValidationError(_build_asset_error(field))
 
     if _looks_like_drive_path(asset):
@@ -216,8 +319,8 @@ def _validate_optional_asset(value: Any, *, field: str) -> Optional[str]:
     if "://" in asset:
         raise ManifestValidationError(_build_asset_error(field))
 
-    path = Path(asset)
-    if path.is_absolute() or ".." in path.parts:
+    # Rooted, UNC, and drive forms were handled above, so only traversal is left to reject.
+    if ".." in asset.replace("\\", "/").split("/"):
         raise ManifestValidationError(_build_asset_error(field))
 
     return asset
@@ -229,8 +332,7 @@ def _validate_optional_sound(value: Any) -> Optional[str]:
     sound = _require_string(value, field="sound", required=False)
     if not sound:
         return None
-    allowed = {"windows_default"}
-    if sound not in allowed:
+    if sound not in _ALLOWED_SOUNDS:
         raise ManifestValidationError(
             "sound must be one of: windows_default."
         )
@@ -238,23 +340,12 @@ def _validate_optional_sound(value: Any) -> Optional[str]:
 
 
 def _looks_like_drive_path(value: str) -> bool:
-    return len(value) >= 3 and value[1] == ":" and value[2] in {"/", "\\"}
+    return len(value) >= 3 and value[1] == ":" and value[2] in _DRIVE_SEPARATORS
 
 
+@lru_cache(maxsize=8)
 def _build_asset_error(field: str) -> str:
-    supported = (
-        "relative file path",
-        "preset:<name>",
-        "http:// or https:// URL",
-        "www. URL",
-        "UNC/share path (e.g. \\\\server\\share)",
-        "drive path (e.g. C:\\folder\\file)",
-    )
-    return (
-        f"{field} must be one of the supported types: "
-        + ", ".join(supported)
-        + "."
-    )
+    return f"{field} must be one of the supported types: " + ", ".join(_SUPPORTED_ASSETS) + "."
 
 
 def _validate_condition_script(value: Any) -> str:
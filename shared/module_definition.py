@@ -4,6 +4,7 @@ Shared representation of a module instance combining manifest data and resolved
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +17,29 @@ def _looks_like_drive_path(value: str) -> bool:
     return len(value) >= 3 and value[1] == ":" and value[2] in {"/", "\\"}
 
 
+def _classify_reference(reference: str) -> tuple[str, str]:
+    """
+    Classify an asset reference as ``preset``, ``url``, ``path`` (absolute) or
+    ``relative``, dispatching on its first character instead of trying every prefix.
+    """
+    first = reference[:1]
+    if first in ("h", "H"):
+        lowered = reference[:8].lower()
+        if lowered.startswith(("https://", "http://")):
+            return "url", reference
+    elif first in ("w", "W"):
+        if reference[:4].lower() == "www.":
+            return "url", "https://" + reference[4:]
+    elif first in ("p", "P"):
+        if reference[:7].lower() == "preset:":
+            return "preset", reference[7:].lower()
+    elif first == "\\":
+        return "path", reference
+    if _looks_like_drive_path(reference):
+        return "path", reference
+    return "relative", reference
+
+
 @dataclass(slots=True)
 class ModuleDefinition:
     """
@@ -25,9 +49,11 @@ class ModuleDefinition:
 
     root: Path
     manifest: Dict[str, Any]
-    media_path: Optional[Path] = field(init=False, default=None)
+    # Copied from the manifest once; display, sorting, and registry writes read them often.
+    title: str = field(init=False, default="")
+    message: str = field(init=False, default="")
+    category: str = field(init=False, default="")
     media_url: Optional[str] = field(init=False, default=None)
-    icon_path: Optional[Path] = field(init=False, default=None)
     icon_url: Optional[str] = field(init=False, default=None)
     icon_preset: Optional[str] = field(init=False, default=None)
     sound: Optional[str] = field(init=False, default=None)
@@ -37,9 +63,18 @@ class ModuleDefinition:
     module_key: Optional[str] = field(init=False, default=None)
     scheduled_utc: Optional[datetime] = field(init=False, default=None)
     expires_utc: Optional[datetime] = field(init=False, default=None)
+    # Module-relative references are resolved against root on first access.
+    _media_path: Optional[Path] = field(init=False, default=None, repr=False)
+    _media_ref: Optional[str] = field(init=False, default=None, repr=False)
+    _icon_path: Optional[Path] = field(init=False, default=None, repr=False)
+    _icon_ref: Optional[str] = field(init=False, default=None, repr=False)
+    _expires_epoch: Optional[float] = field(init=False, default=None, repr=False)
 
     def __post_init__(self) -> None:
         self.module_key = self.root.name
+        self.title = self.manifest.get("title", "")
+        self.message = self.manifest.get("message", "")
+        self.category = self.manifest.get("category", "")
         raw_type = self.manifest.get("type") or "standard"
         if isinstance(raw_type, str):
             self.notification_type = raw_type.lower()
@@ -76,47 +111,52 @@ class ModuleDefinition:
         expires_value = self.manifest.get("expires")
         if isinstance(expires_value, str) and expires_value.strip():
             self.expires_utc = parse_iso8601_utc(expires_value)
+            self._expires_epoch = self.expires_utc.timestamp()
 
     def _assign_media(self, reference: str) -> None:
-        lowered = reference.lower()
-        if lowered.startswith(("https://", "http://")):
-            self.media_url = reference
-            return
-        if lowered.startswith("www."):
-            self.media_url = "https://" + reference[4:]
-            return
-        if reference.startswith("\\") or _looks_like_drive_path(reference):
-            self.media_path = Path(reference)
-            return
-        self.media_path = (self.root / reference).resolve()
+        kind, value = _classify_reference(reference)
+        if kind == "url":
+            self.media_url = value
+        elif kind == "path":
+            self._media_path = Path(value)
+        else:
+            # Media has no presets, so "preset:..." is an ordinary relative path.
+            self._media_ref = reference
 
     def _assign_icon(self, reference: str) -> None:
-        lowered = reference.lower()
-        if lowered.startswith("preset:"):
-            self.icon_preset = lowered.split(":", 1)[1] or None
-            return
-        if lowered.startswith(("https://", "http://")):
-            self.icon_url = reference
-            return
-        if lowered.startswith("www."):
-            self.icon_url = "https://" + reference[4:]
-            return
-        if reference.startswith("\\") or _looks_like_drive_path(reference):
-            self.icon_path = Path(reference)
-            return
-        self.icon_path = (self.root / reference).resolve()
+        kind, value = _classify_reference(reference)
+        if kind == "preset":
+            self.icon_preset = value or None
+        elif kind == "url":
+            self.icon_url = value
+        elif kind == "path":
+            self._icon_path = Path(value)
+        else:
+            self._icon_ref = value
 
     @property
-    def title(self) -> str:
-        return self.manifest.get("title", "")
+    def media_path(self) -> Optional[Path]:
+        if self._media_ref is not None:
+            self._media_path = (self.root / self._media_ref).resolve()
+            self._media_ref = None
+        return self._media_path
 
-    @property
-    def message(self) -> str:
-        return self.manifest.get("message", "")
+    @media_path.setter
+    def media_path(self, value: Optional[Path]) -> None:
+        self._media_path = value
+        self._media_ref = None
 
     @property
-    def category(self) -> str:
-        return self.manifest.get("category", "")
+    def icon_path(self) -> Optional[Path]:
+        if self._icon_ref is not None:
+            self._icon_path = (self.root / self._icon_ref).resolve()
+            self._icon_ref = None
+        return self._icon_path
+
+    @icon_path.setter
+    def icon_path(self, value: Optional[Path]) -> None:
+        self._icon_path = value
+        self._icon_ref = None
 
     @property
     def scheduled_time(self) -> Optional[datetime]:
@@ -130,16 +170,28 @@ class ModuleDefinition:
     def is_conditional(self) -> bool:
         return self.notification_type == "conditional"
 
-    def is_expired(self, *, reference: Optional[datetime] = None) -> bool:
-        """Return whether the module has expired."""
-        if self.expires_utc is None:
+    def is_expired(
+        self,
+        *,
+        reference: Optional[datetime] = None,
+        reference_epoch: Optional[float] = None,
+    ) -> bool:
+        """
+        Return whether the module has expired.
+
+        Scans comparing many modules against one instant should pass
+        ``reference_epoch`` (seconds since the epoch), which is a float compare.
+        """
+        if self._expires_epoch is None:
             return False
 
-        reference_dt = reference or datetime.utcnow()
-        if reference_dt.tzinfo is None:
-            return reference_dt >= self.expires_utc.replace(tzinfo=None)
+        if reference is None:
+            return (time.time() if reference_epoch is None else reference_epoch) >= self._expires_epoch
+
+        if reference.tzinfo is None:
+            return reference >= self.expires_utc.replace(tzinfo=None)
 
-        return reference_dt >= self.expires_utc
+        return reference >= self.expires_utc
 
 
 def _coerce_interval(value: Any) -> int:
@@ -6,13 +6,14 @@ from __future__ import annotations
 
 import sys
 
-from PySide6.QtWidgets import QApplication
-
-from windows_notifier_builder.windows_notifier_builder.builder_app import BuilderApp
-
 
 def main() -> int:
     """Launch the builder GUI."""
+    # Qt and the builder UI are imported here so importing this module stays cheap.
+    from PySide6.QtWidgets import QApplication
+
+    from windows_notifier_builder.windows_notifier_builder.builder_app import BuilderApp
+
     app = QApplication(sys.argv)
     builder = BuilderApp()
     builder.start()
@@ -5,8 +5,9 @@ Main application controller for the builder UI.
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Optional
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import QMessageBox
 
 from shared.module_definition import ModuleDefinition
@@ -14,11 +15,34 @@ from shared.module_definition import ModuleDefinition
 from . import logger
 from .manifest_form import FormData, ManifestForm
 from .media_picker import MediaPicker
-from .module_writer import ModuleWriter
+from .module_writer import ModuleWriter, ModuleWriteResult
 from .preview_windows import PreviewCoordinator
 from .intune_packager import IntunePackager
 
 
+class _WriteSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+class _WriteRunnable(QRunnable):
+    """Runs ``ModuleWriter.write`` on the global thread pool and reports back via signals."""
+
+    def __init__(self, writer: ModuleWriter, data: FormData, signals: _WriteSignals) -> None:
+        super().__init__()
+        self._writer = writer
+        self._data = data
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            result = self._writer.write(self._data)
+        except Exception as exc:  # pragma: no cover - GUI error path
+            self._signals.failed.emit(exc)
+        else:
+            self._signals.finished.emit(result)
+
+
 class BuilderApp(QObject):
     """Coordinates the builder workflow."""
 
@@ -30,6 +54,8 @@ class BuilderApp(QObject):
         self._preview = PreviewCoordinator()
         self._packager = IntunePackager(modules_dir=self._module_writer.modules_dir)
         self._form = ManifestForm(media_picker=self._media_picker, modules_dir=self._module_writer.modules_dir)
+        # Signal carrier for the write in flight; None when no save is running.
+        self._pending_write: Optional[_WriteSignals] = None
 
         self._form.saveRequested.connect(self._handle_save)  # type: ignore[arg-type]
         self._form.previewPopupRequested.connect(self._handle_preview_popup)  # type: ignore[arg-type]
@@ -42,13 +68,31 @@ class BuilderApp(QObject):
         self._form.show()
 
     def _handle_save(self, data: FormData) -> None:
-        try:
-            result = self._module_writer.write(data)
-        except Exception as exc:  # pragma: no cover - GUI error path
-            self._logger.exception("Failed to write module: %s", exc)
-            QMessageBox.critical(self._form, "Save Error", str(exc))
+        # Copies, validation, and hashing run off the GUI thread; the results
+        # come back through queued signals.
+        if self._pending_write is not None:
+            self._logger.debug("Save requested while another save is running; ignoring.")
             return
-
+        signals = self._pending_write = _WriteSignals(self)
+        signals.finished.connect(self._on_save_finished)
+        signals.failed.connect(self._on_save_failed)
+        self._form.set_saving(True)
+        QThreadPool.globalInstance().start(_WriteRunnable(self._module_writer, data, signals))
+
+    def _end_save(self) -> None:
+        signals, self._pending_write = self._pending_write, None
+        if signals is not None:
+            signals.deleteLater()
+        self._form.set_saving(False)
+
+    def _on_save_failed(self, exc: Exception) -> None:
+        self._end_save()
+        self._logger.opt(exception=exc).error("Failed to write module: %s", exc)
+        self._form.set_status_message("Save failed.")
+        QMessageBox.critical(self._form, "Save Error", str(exc))
+
+    def _on_save_finished(self, result: ModuleWriteResult) -> None:
+        self._end_save()
         self._logger.info("Module saved to %s (ID: %s)", result.module_path, result.module_id)
         self._form.set_status_message(f"Saved to {result.module_path} (ID: {result.module_id})")
         QMessageBox.information(
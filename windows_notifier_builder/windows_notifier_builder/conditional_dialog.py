@@ -5,7 +5,7 @@ Dialog for configuring conditional notification scripts.
 from __future__ import annotations
 
 import subprocess
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -77,6 +77,13 @@ class ConditionalDialog(QDialog):
         button_row.addWidget(save_button)
         layout.addLayout(button_row)
 
+    def reset(self) -> None:
+        """Restore the initial field values so one dialog instance can be reused."""
+        self._script_path = None
+        self._script_label.setText("No script selected")
+        self._interval_spin.setValue(60)
+        self._expires_edit.setDateTime(QDateTime.currentDateTimeUtc().addSecs(3600))
+
     def _browse_script(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -139,13 +146,11 @@ class ConditionalDialog(QDialog):
 
     @property
     def expires_iso(self) -> str:
-        qdt = self._expires_edit.dateTime().toUTC()
-        dt = datetime.fromtimestamp(qdt.toSecsSinceEpoch(), tz=timezone.utc).replace(microsecond=0)
-        return dt.isoformat().replace("+00:00", "Z")
+        seconds = self._expires_edit.dateTime().toSecsSinceEpoch()
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
 
     def _validate_expiration(self) -> bool:
-        expires_dt = datetime.fromtimestamp(self._expires_edit.dateTime().toUTC().toSecsSinceEpoch(), tz=timezone.utc)
-        if expires_dt <= datetime.now(timezone.utc):
+        if self._expires_edit.dateTime().toSecsSinceEpoch() <= time.time():
             QMessageBox.warning(self, "Invalid Expiration", "Choose an expiration time in the future.")
             return False
         return True
@@ -0,0 +1,41 @@
+"""
+File copies that let Windows copy in the kernel with CopyFileW.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import shutil
+from typing import Union
+
+_copy_file_w = None
+
+
+def copy_file(source: Union[str, os.PathLike], destination: Union[str, os.PathLike]):
+    """
+    Copy ``source`` to ``destination`` with CopyFileW, falling back to
+    ``shutil.copy2`` elsewhere. Usable as a ``copytree`` copy function.
+    """
+    copy_file_w = _get_copy_file_w()
+    if copy_file_w is None:
+        return shutil.copy2(source, destination)
+    if not copy_file_w(os.fspath(source), os.fspath(destination), False):
+        error = ctypes.get_last_error()
+        raise OSError(error, ctypes.FormatError(error), os.fspath(source))  # type: ignore[attr-defined]
+    return destination
+
+
+def _get_copy_file_w():
+    global _copy_file_w
+    if _copy_file_w is None:
+        try:
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+        except (AttributeError, OSError):
+            _copy_file_w = False
+        else:
+            function = kernel32.CopyFileW
+            function.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_int)
+            function.restype = ctypes.c_int
+            _copy_file_w = function
+    return _copy_file_w or None
@@ -4,14 +4,19 @@ Utility for packaging modules into Intune .intunewin archives.
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 import tempfile
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
 from . import logger
+from .file_copy import copy_file
+
+_MAX_COPY_WORKERS = 8
 
 
 class IntunePackager:
@@ -35,10 +40,14 @@ class IntunePackager:
         if not modules:
             raise ValueError("Select at least one module to package.")
 
+        # Compare normalised strings rather than walking Path.parents for each module.
+        modules_root = os.path.normcase(str(self.modules_dir))
+        modules_prefix = modules_root.rstrip(os.sep) + os.sep
         for module in modules:
             if not module.exists():
                 raise FileNotFoundError(f"Module folder '{module}' not found.")
-            if self.modules_dir not in module.parents and module != self.modules_dir:
+            module_str = os.path.normcase(str(module))
+            if not module_str.startswith(modules_prefix) and module_str != modules_root:
                 raise ValueError(f"Module '{module}' must live under {self.modules_dir}.")
 
         if not self.tool_path.exists():
@@ -53,10 +62,7 @@ class IntunePackager:
         staging_dir = Path(tempfile.mkdtemp(prefix="intune_pkg_"))
         self._logger.info("Creating Intune package staging folder at %s", staging_dir)
         try:
-            for module in modules:
-                destination = staging_dir / module.name
-                self._logger.info("Copying module %s to staging area", module)
-                shutil.copytree(module, destination)
+            self._copy_modules(modules, staging_dir)
 
             shutil.copy2(self.install_script, staging_dir / self.install_script.name)
 
@@ -76,11 +82,11 @@ class IntunePackager:
                 "-q",
             ]
             self._logger.info("Running IntuneWinAppUtil: %s", " ".join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # One pipe with both streams interleaved; it is only read for the error message.
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
             if result.returncode != 0:
                 raise RuntimeError(
-                    "IntuneWinAppUtil failed with exit code %s:\n%s\n%s"
-                    % (result.returncode, result.stdout, result.stderr)
+                    "IntuneWinAppUtil failed with exit code %s:\n%s" % (result.returncode, result.stdout)
                 )
 
             if not default_package.exists():
@@ -88,7 +94,7 @@ class IntunePackager:
                     f"Expected output '{default_package.name}' not found in {self.output_dir}."
                 )
 
-            timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+            timestamp = time.strftime("%Y%m%d%H%M%S", time.gmtime())
             if len(modules) == 1:
                 base = modules[0].name
             else:
@@ -102,3 +108,15 @@ class IntunePackager:
             return final_path
         finally:
             shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _copy_modules(self, modules: list[Path], staging_dir: Path) -> None:
+        """Copy module folders into the staging area concurrently; copying is I/O-bound."""
+
+        def copy_module(module: Path) -> None:
+            self._logger.info("Copying module %s to staging area", module)
+            shutil.copytree(module, staging_dir / module.name, copy_function=copy_file)
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_COPY_WORKERS, len(modules))) as executor:
+            # Consume the results so the first copy error is re-raised here.
+            list(executor.map(copy_module, modules))
+
@@ -7,8 +7,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from loguru import logger as _logger
-
 _LOG_INITIALISED = False
 
 
@@ -24,4 +22,7 @@ def configure(log_path: Optional[Path] = None) -> None:
 def get_logger():
     """Return the shared logger instance, configuring on first use."""
     configure()
-    return _logger
+    # Imported on first use so callers that never log skip loading loguru.
+    from loguru import logger
+
+    return logger
@@ -4,15 +4,24 @@ Form window for authoring module manifests.
 
 from __future__ import annotations
 
-import json
-import tempfile
+import os
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QDateTime, QSize, Qt, QSignalBlocker, Signal, QUrl
-from PySide6.QtGui import QDesktopServices, QIcon
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QDateTime,
+    QModelIndex,
+    QSize,
+    Qt,
+    QSignalBlocker,
+    QTimer,
+    Signal,
+    Slot,
+    QUrl,
+)
+from PySide6.QtGui import QDesktopServices, QIcon, QPixmap
 from PySide6.QtWidgets import (
     QButtonGroup,
     QCheckBox,
@@ -24,8 +33,7 @@ from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QLineEdit,
     QMenu,
     QMessageBox,
@@ -33,6 +41,7 @@ from PySide6.QtWidgets import (
     QRadioButton,
     QSizePolicy,
     QSpacerItem,
+    QStackedWidget,
     QStyle,
     QTextEdit,
     QToolButton,
@@ -40,7 +49,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from shared.manifest_schema import ManifestValidationError, load_and_validate_manifest
+from shared.manifest_schema import ManifestValidationError, validate_manifest_dict
 
 from .conditional_dialog import ConditionalDialog
 from .media_picker import MediaPicker
@@ -48,6 +57,98 @@ from .media_picker import MediaPicker
 
 ASSETS_DIR = Path(__file__).resolve().parent / "Assets"
 IDEA_ICON_PATH = ASSETS_DIR / "idea.png"
+# Bundled asset; checked once instead of on every preview refresh.
+_IDEA_ICON_AVAILABLE = IDEA_ICON_PATH.exists()
+_PREVIEW_DEBOUNCE_MS = 60
+# Modules directory -> (st_mtime_ns, sorted subfolders) from its last listing.
+_MODULES_CACHE: dict[Path, tuple[int, list[Path]]] = {}
+_ISO_Z_FORMAT = "yyyy-MM-dd'T'HH:mm:ss'Z'"
+_DEFAULT_PRESET_ICON = QStyle.StandardPixmap.SP_MessageBoxInformation
+_PRESET_ICON_MAP: dict[str, QStyle.StandardPixmap] = {
+    "info": _DEFAULT_PRESET_ICON,
+    "warning": QStyle.StandardPixmap.SP_MessageBoxWarning,
+    "reminder": QStyle.StandardPixmap.SP_BrowserReload,
+}
+
+# Preview action buttons match by property instead of carrying their own sheets.
+_FORM_QSS = """
+QWidget#ManifestForm {
+    background-color: #1d1d23;
+    color: #f2f2f5;
+}
+QLabel[sectionTitle="true"] {
+    font-weight: 600;
+    margin-top: 6px;
+}
+QLineEdit, QTextEdit, QDateTimeEdit, QComboBox {
+    background-color: #2b2b33;
+    border: 1px solid #3f3f50;
+    border-radius: 6px;
+    padding: 4px;
+    color: #f2f2f5;
+}
+QTextEdit {
+    padding: 6px;
+}
+QCheckBox, QRadioButton {
+    padding: 2px;
+}
+QPushButton {
+    background-color: #3c3c4a;
+    color: #f2f2f5;
+    border-radius: 6px;
+    padding: 6px 12px;
+}
+QPushButton:hover {
+    background-color: #4b4b5d;
+}
+QPushButton:pressed {
+    background-color: #32323f;
+}
+QLabel#StatusLabel {
+    color: #a8a8b5;
+    min-height: 18px;
+}
+QFrame#PreviewContainer {
+    background-color: #24242c;
+    border-radius: 12px;
+    border: 1px solid rgba(255, 255, 255, 0.10);
+}
+QLabel#PreviewTitle {
+    font-weight: 600;
+    font-size: 14px;
+}
+QLabel#PreviewMessage {
+    color: rgba(240, 240, 245, 0.85);
+}
+QLabel#PreviewIcon {
+    background-color: rgba(255, 255, 255, 0.08);
+    border-radius: 10px;
+}
+QToolButton#InfoButton {
+    background: none;
+    border: none;
+    color: #f2f2f5;
+    padding: 4px 8px;
+}
+QToolButton#InfoButton::menu-indicator {
+    image: none;
+}
+QLabel#IconPreview {
+    background-color: rgba(255, 255, 255, 0.05);
+    border-radius: 8px;
+}
+QToolButton[previewAction="true"] {
+    background-color: rgba(255, 255, 255, 0.12);
+    border-radius: 22px;
+}
+QToolButton[previewAction="true"]:hover {
+    background-color: rgba(255, 255, 255, 0.22);
+}
+QToolButton[previewAction="true"]:pressed {
+    background-color: rgba(255, 255, 255, 0.30);
+}
+"""
 
 
 # ---------------------------------------------------------------------------#
@@ -103,9 +204,19 @@ class ManifestForm(QWidget):
         self.media_picker = media_picker or MediaPicker()
         self._selected_media_path: Optional[Path] = None
         self._selected_icon_path: Optional[Path] = None
-        self._modules_dir = Path(modules_dir or "./Modules").resolve()
-
-        self._build_ui()
+        # Resolved when the Intune dialog opens, not while the form is being built.
+        self._modules_dir = Path(modules_dir or "./Modules")
+        self._conditional_dialog: Optional[ConditionalDialog] = None
+        self._error_box: Optional[QMessageBox] = None
+        self._cached_message = ""
+        # Icon mode -> rendered 48x48 preview pixmap; "file" is dropped on each browse.
+        self._preview_pixmap_cache: dict[str, QPixmap] = {}
+
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
         self._connect_dynamic_signals()
 
         # Initialise dependent UI state.
@@ -123,6 +234,8 @@ class ManifestForm(QWidget):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(16, 12, 16, 16)
         main_layout.setSpacing(10)
+        # Hold geometry updates until every row is added; re-enabled below.
+        main_layout.setEnabled(False)
 
         header_row = QHBoxLayout()
 
@@ -134,14 +247,11 @@ class ManifestForm(QWidget):
 
         header_row.addSpacerItem(QSpacerItem(20, 10, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
 
-        info_menu = QMenu("Info", self)
-        info_menu.addAction("About", self._show_about_dialog)
-        info_menu.addAction("Readme", self._open_readme)
-
+        # The Info menu is built on the first click; see _show_info_menu.
         self._info_button = QToolButton()
         self._info_button.setText("Info")
         self._info_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-        self._info_button.setMenu(info_menu)
+        self._info_button.clicked.connect(self._show_info_menu)
         self._info_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self._info_button.setObjectName("InfoButton")
         header_row.addWidget(self._info_button)
@@ -260,6 +370,7 @@ class ManifestForm(QWidget):
         main_layout.addLayout(media_icon_row)
         main_layout.addWidget(self._create_divider())
 
+        # File and link controls share one stacked row per section; see media_type_changed.
         self._media_file_controls = QWidget()
         file_controls_layout = QHBoxLayout(self._media_file_controls)
         file_controls_layout.setContentsMargins(0, 0, 0, 0)
@@ -270,7 +381,6 @@ class ManifestForm(QWidget):
         media_browse_button.clicked.connect(self._browse_media_file)
         file_controls_layout.addWidget(self._media_path_label)
         file_controls_layout.addWidget(media_browse_button)
-        main_layout.addWidget(self._media_file_controls)
 
         self._media_link_controls = QWidget()
         link_controls_layout = QHBoxLayout(self._media_link_controls)
@@ -279,7 +389,11 @@ class ManifestForm(QWidget):
         self._media_url_input = QLineEdit()
         self._media_url_input.setPlaceholderText("https://…")
         link_controls_layout.addWidget(self._media_url_input)
-        main_layout.addWidget(self._media_link_controls)
+
+        self._media_stack = QStackedWidget()
+        self._media_stack.addWidget(self._media_file_controls)
+        self._media_stack.addWidget(self._media_link_controls)
+        main_layout.addWidget(self._media_stack)
 
         self._icon_file_controls = QWidget()
         icon_file_layout = QHBoxLayout(self._icon_file_controls)
@@ -291,7 +405,6 @@ class ManifestForm(QWidget):
         icon_browse_button.clicked.connect(self._browse_icon_file)
         icon_file_layout.addWidget(self._icon_path_label)
         icon_file_layout.addWidget(icon_browse_button)
-        main_layout.addWidget(self._icon_file_controls)
 
         self._icon_url_controls = QWidget()
         icon_url_layout = QHBoxLayout(self._icon_url_controls)
@@ -300,7 +413,11 @@ class ManifestForm(QWidget):
         self._icon_url_input = QLineEdit()
         self._icon_url_input.setPlaceholderText("https://…")
         icon_url_layout.addWidget(self._icon_url_input)
-        main_layout.addWidget(self._icon_url_controls)
+
+        self._icon_stack = QStackedWidget()
+        self._icon_stack.addWidget(self._icon_file_controls)
+        self._icon_stack.addWidget(self._icon_url_controls)
+        main_layout.addWidget(self._icon_stack)
 
         main_layout.addWidget(self._create_divider())
 
@@ -372,6 +489,7 @@ class ManifestForm(QWidget):
         preview_layout.addLayout(preview_actions)
 
         main_layout.addWidget(self._preview_container)
+        main_layout.setEnabled(True)
 
         self._apply_styles()
 
@@ -380,76 +498,7 @@ class ManifestForm(QWidget):
         self._conditional_button.clicked.connect(self._handle_conditional_request)
 
     def _apply_styles(self) -> None:
-        self.setStyleSheet(
-            """
-            QWidget#ManifestForm {
-                background-color: #1d1d23;
-                color: #f2f2f5;
-            }
-            QLabel[sectionTitle="true"] {
-                font-weight: 600;
-                margin-top: 6px;
-            }
-            QLineEdit, QTextEdit, QDateTimeEdit, QComboBox {
-                background-color: #2b2b33;
-                border: 1px solid #3f3f50;
-                border-radius: 6px;
-                padding: 4px;
-                color: #f2f2f5;
-            }
-            QTextEdit {
-                padding: 6px;
-            }
-            QCheckBox, QRadioButton {
-                padding: 2px;
-            }
-            QPushButton {
-                background-color: #3c3c4a;
-                color: #f2f2f5;
-                border-radius: 6px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #4b4b5d;
-            }
-            QPushButton:pressed {
-                background-color: #32323f;
-            }
-            QLabel#StatusLabel {
-                color: #a8a8b5;
-                min-height: 18px;
-            }
-            QFrame#PreviewContainer {
-                background-color: #24242c;
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.10);
-            }
-            QLabel#PreviewTitle {
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QLabel#PreviewMessage {
-                color: rgba(240, 240, 245, 0.85);
-            }
-            QLabel#PreviewIcon {
-                background-color: rgba(255, 255, 255, 0.08);
-                border-radius: 10px;
-            }
-            QToolButton#InfoButton {
-                background: none;
-                border: none;
-                color: #f2f2f5;
-                padding: 4px 8px;
-            }
-            QToolButton#InfoButton::menu-indicator {
-                image: none;
-            }
-            QLabel#IconPreview {
-                background-color: rgba(255, 255, 255, 0.05);
-                border-radius: 8px;
-            }
-            """
-        )
+        self.setStyleSheet(_FORM_QSS)
 
     def _create_divider(self) -> QFrame:
         line = QFrame()
@@ -465,36 +514,43 @@ class ManifestForm(QWidget):
         button.setIconSize(QSize(26, 26))
         button.setToolTip(tooltip)
         button.setFixedSize(44, 44)
-        button.setStyleSheet(
-            """
-            QToolButton {
-                background-color: rgba(255, 255, 255, 0.12);
-                border-radius: 22px;
-            }
-            QToolButton:hover {
-                background-color: rgba(255, 255, 255, 0.22);
-            }
-            QToolButton:pressed {
-                background-color: rgba(255, 255, 255, 0.30);
-            }
-            """
-        )
+        # Styled by the form's QToolButton[previewAction="true"] rules.
+        button.setProperty("previewAction", True)
         return button
 
     def _connect_dynamic_signals(self) -> None:
-        self._message_input.textChanged.connect(self.update_char_counter)
-        self._message_input.textChanged.connect(self._refresh_preview)
-        self._title_input.textChanged.connect(self._refresh_preview)
-        self._icon_combo.currentIndexChanged.connect(self.icon_type_changed)
-        self._icon_url_input.textChanged.connect(self._refresh_preview)
-        self._schedule_checkbox.toggled.connect(self.schedule_toggle)
+        # Typing restarts a short single-shot timer so a burst of keystrokes
+        # refreshes the preview once; the character counter stays immediate.
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(_PREVIEW_DEBOUNCE_MS)
+        # Everything here lives on the GUI thread and fires per keystroke or
+        # toggle, so connect directly rather than re-checking thread affinity.
+        direct = Qt.ConnectionType.DirectConnection
+        self._preview_timer.timeout.connect(self._refresh_preview, direct)
+
+        self._message_input.textChanged.connect(self._on_message_changed, direct)
+        self._title_input.textChanged.connect(self._schedule_preview_refresh, direct)
+        self._icon_combo.currentIndexChanged.connect(self.icon_type_changed, direct)
+        self._icon_url_input.textChanged.connect(self._schedule_preview_refresh, direct)
+        self._schedule_checkbox.toggled.connect(self.schedule_toggle, direct)
         for button in (self._media_none, self._media_file, self._media_link):
-            button.toggled.connect(self.media_type_changed)
+            button.toggled.connect(self.media_type_changed, direct)
+
+    @Slot()
+    def _on_message_changed(self) -> None:
+        self.update_char_counter()
+        self._schedule_preview_refresh()
+
+    @Slot()
+    def _schedule_preview_refresh(self, *_args) -> None:
+        self._preview_timer.start()
 
     # ------------------------------------------------------------------#
     # Dynamic behaviour stubs
     # ------------------------------------------------------------------#
 
+    @Slot()
     def media_type_changed(self) -> None:
         """Update media controls when the user chooses None/File/Link."""
         if self._media_none.isChecked():
@@ -504,8 +560,12 @@ class ManifestForm(QWidget):
         else:
             choice = "link"
 
-        self._media_file_controls.setVisible(choice == "file")
-        self._media_link_controls.setVisible(choice == "link")
+        # Switch pages first so showing the stack is the only visibility change.
+        if choice != "none":
+            self._media_stack.setCurrentWidget(
+                self._media_file_controls if choice == "file" else self._media_link_controls
+            )
+        self._media_stack.setVisible(choice != "none")
 
         if choice != "file":
             self._selected_media_path = None
@@ -513,11 +573,15 @@ class ManifestForm(QWidget):
         if choice != "link":
             self._media_url_input.clear()
 
+    @Slot()
     def icon_type_changed(self) -> None:
         """Update icon controls and preview when the selection changes."""
         mode = self._icon_combo.currentData()
-        self._icon_file_controls.setVisible(mode == "file")
-        self._icon_url_controls.setVisible(mode == "url")
+        if mode in ("file", "url"):
+            self._icon_stack.setCurrentWidget(
+                self._icon_file_controls if mode == "file" else self._icon_url_controls
+            )
+        self._icon_stack.setVisible(mode in ("file", "url"))
 
         if mode != "file":
             self._selected_icon_path = None
@@ -528,42 +592,46 @@ class ManifestForm(QWidget):
         self._update_icon_preview()
         self._refresh_preview()
 
+    @Slot()
     def schedule_toggle(self) -> None:
         """Enable/disable schedule picker."""
         checked = self._schedule_checkbox.isChecked()
         self._schedule_edit.setEnabled(checked)
 
+    @Slot()
     def update_char_counter(self) -> None:
         """Keep the message text within 240 characters and refresh counter."""
+        # The text is capped at 240 characters, so reading it stays cheap. Qt's
+        # characterCount() counts UTF-16 units and would overcount emoji.
         text = self._message_input.toPlainText()
         if len(text) > 240:
-            blocker = QSignalBlocker(self._message_input)
-            try:
-                trimmed = text[:240]
-                self._message_input.setPlainText(trimmed)
+            text = text[:240]
+            with QSignalBlocker(self._message_input):
+                self._message_input.setPlainText(text)
                 cursor = self._message_input.textCursor()
-                cursor.setPosition(len(trimmed))
+                cursor.setPosition(len(text))
                 self._message_input.setTextCursor(cursor)
-                text = trimmed
-            finally:
-                del blocker
+        # Read once per edit; the preview and form collection reuse it.
+        self._cached_message = text
         self._message_counter.setText(f"{len(text)} / 240")
 
+    @Slot()
     def preview_notification(self) -> None:
         """Emit previewPopupRequested with current form data."""
         try:
             data = self._collect_form_data()
         except (ValueError, ManifestValidationError) as exc:
-            QMessageBox.warning(self, "Validation Error", str(exc))
+            self._show_validation_error(str(exc))
             return
         self.previewPopupRequested.emit(data)
 
+    @Slot()
     def save(self) -> None:
         """Emit saveRequested with current form data."""
         try:
             data = self._collect_form_data()
         except (ValueError, ManifestValidationError) as exc:
-            QMessageBox.warning(self, "Validation Error", str(exc))
+            self._show_validation_error(str(exc))
             return
         self.saveRequested.emit(data)
 
@@ -571,15 +639,17 @@ class ManifestForm(QWidget):
     # UI helpers
     # ------------------------------------------------------------------#
 
+    @Slot()
     def _preview_media_content(self) -> None:
         """Emit previewContentRequested with current form data."""
         try:
             data = self._collect_form_data()
         except (ValueError, ManifestValidationError) as exc:
-            QMessageBox.warning(self, "Validation Error", str(exc))
+            self._show_validation_error(str(exc))
             return
         self.previewContentRequested.emit(data)
 
+    @Slot()
     def _browse_media_file(self) -> None:
         path = self.media_picker.pick_media_file(parent=self)
         if path:
@@ -588,8 +658,10 @@ class ManifestForm(QWidget):
         else:
             self._media_path_label.setText("No file selected")
 
+    @Slot()
     def _browse_icon_file(self) -> None:
         path = self.media_picker.pick_icon_file(parent=self)
+        self._preview_pixmap_cache.pop("file", None)
         if path:
             self._selected_icon_path = path
             self._icon_path_label.setText(str(path))
@@ -599,14 +671,20 @@ class ManifestForm(QWidget):
         self._update_icon_preview()
         self._refresh_preview()
 
+    @Slot()
     def _handle_conditional_request(self) -> None:
         try:
             base_data = self._collect_form_data()
         except (ValueError, ManifestValidationError) as exc:
-            QMessageBox.warning(self, "Validation Error", str(exc))
+            self._show_validation_error(str(exc))
             return
 
-        dialog = ConditionalDialog(self)
+        # Built on first use and reset for each request instead of rebuilt every time.
+        dialog = self._conditional_dialog
+        if dialog is None:
+            dialog = self._conditional_dialog = ConditionalDialog(self)
+        else:
+            dialog.reset()
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
 
@@ -643,47 +721,55 @@ class ManifestForm(QWidget):
         self.saveRequested.emit(conditional_data)
 
     def _update_icon_preview(self) -> None:
-        icon = self._resolve_icon_for_preview(self._icon_combo.currentData())
-        if icon:
-            self._icon_preview.setPixmap(icon.pixmap(48, 48))
-        else:
-            self._icon_preview.clear()
+        self._icon_preview.setPixmap(self._resolve_preview_pixmap(self._icon_combo.currentData()))
 
-    def _resolve_icon_for_preview(self, mode: str | None) -> Optional[QIcon]:
+    def _resolve_preview_pixmap(self, mode: str | None) -> QPixmap:
+        """Return the 48x48 preview pixmap for an icon mode, rasterising each one once."""
+        if mode == "file" and self._selected_icon_path:
+            key = "file"
+        elif isinstance(mode, str) and (mode.startswith("preset:") or mode == "url"):
+            key = mode
+        else:
+            key = ""
+        pixmap = self._preview_pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self._resolve_icon_for_preview(mode).pixmap(48, 48)
+            self._preview_pixmap_cache[key] = pixmap
+        return pixmap
+
+    def _resolve_icon_for_preview(self, mode: str | None) -> QIcon:
         if isinstance(mode, str) and mode.startswith("preset:"):
             preset_name = mode.split(":", 1)[1]
-            mapping = {
-                "info": QStyle.StandardPixmap.SP_MessageBoxInformation,
-                "warning": QStyle.StandardPixmap.SP_MessageBoxWarning,
-                "reminder": QStyle.StandardPixmap.SP_BrowserReload,
-            }
-            if preset_name == "idea" and IDEA_ICON_PATH.exists():
+            if preset_name == "idea" and _IDEA_ICON_AVAILABLE:
                 return QIcon(str(IDEA_ICON_PATH))
-            standard = mapping.get(preset_name, QStyle.StandardPixmap.SP_MessageBoxInformation)
+            standard = _PRESET_ICON_MAP.get(preset_name, _DEFAULT_PRESET_ICON)
             return self.style().standardIcon(standard)
         if mode == "file" and self._selected_icon_path:
             return QIcon(str(self._selected_icon_path))
-        if mode == "url":
-            return self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation)
-        return self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation)
+        # URL icons are only fetched by the runtime, so they preview as the default too.
+        return self.style().standardIcon(_DEFAULT_PRESET_ICON)
 
+    @Slot()
     def _refresh_preview(self) -> None:
         """Update the live preview card."""
         title = self._title_input.text().strip() or "Notification Title"
-        message = self._message_input.toPlainText().strip() or "Notification message will appear here."
+        message = self._cached_message.strip() or "Notification message will appear here."
 
         self._preview_title.setText(title)
         self._preview_message.setText(message)
 
-        icon = self._resolve_icon_for_preview(self._icon_combo.currentData())
-        if icon:
-            self._preview_icon.setPixmap(icon.pixmap(48, 48))
-        else:
-            self._preview_icon.clear()
+        self._preview_icon.setPixmap(self._resolve_preview_pixmap(self._icon_combo.currentData()))
 
     def set_status_message(self, message: str) -> None:
         self._status_label.setText(message)
 
+    def set_saving(self, saving: bool) -> None:
+        """Disable both save buttons while a module is being written."""
+        self._save_button.setEnabled(not saving)
+        self._conditional_button.setEnabled(not saving)
+        if saving:
+            self._status_label.setText("Saving module…")
+
     # ------------------------------------------------------------------#
     # Data handling
     # ------------------------------------------------------------------#
@@ -691,7 +777,7 @@ class ManifestForm(QWidget):
     def _collect_form_data(self) -> FormData:
         manifest = {
             "title": self._title_input.text().strip(),
-            "message": self._message_input.toPlainText().strip(),
+            "message": self._cached_message.strip(),
             "category": "General",
         }
 
@@ -701,9 +787,7 @@ class ManifestForm(QWidget):
             raise ValueError("Message is required.")
 
         if self._expires_checkbox.isChecked():
-            manifest["expires"] = self._current_expiry_iso()
-        else:
-            manifest.pop("expires", None)
+            manifest["expires"] = self._iso_utc(self._expires_edit)
 
         media_file: Optional[Path] = None
         media_url: Optional[str] = None
@@ -717,8 +801,6 @@ class ManifestForm(QWidget):
             if not media_url:
                 raise ValueError("Enter a media link or choose a different option.")
             manifest["media"] = media_url
-        else:
-            manifest.pop("media", None)
 
         icon_file: Optional[Path] = None
         icon_url: Optional[str] = None
@@ -737,22 +819,16 @@ class ManifestForm(QWidget):
             if not icon_url:
                 raise ValueError("Enter an icon URL or select another option.")
             manifest["icon"] = icon_url
-        else:
-            manifest.pop("icon", None)
 
         schedule_value: Optional[str] = None
         if self._schedule_checkbox.isChecked():
-            schedule_value = self._current_schedule_iso()
+            schedule_value = self._iso_utc(self._schedule_edit)
             manifest["schedule"] = schedule_value
-        else:
-            manifest.pop("schedule", None)
 
         sound_value: Optional[str] = None
         if self._sound_checkbox.isChecked():
             sound_value = "windows_default"
             manifest["sound"] = sound_value
-        else:
-            manifest.pop("sound", None)
 
         normalized = self._validate_manifest(manifest)
 
@@ -769,26 +845,45 @@ class ManifestForm(QWidget):
             condition_interval_minutes=None,
         )
 
-    def _validate_manifest(self, manifest: dict) -> dict:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "manifest.json"
-            manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
-            return load_and_validate_manifest(manifest_path)
+    def _show_validation_error(self, message: str) -> None:
+        """Show ``message`` in the form's validation dialog, built on first use."""
+        box = self._error_box
+        if box is None:
+            box = self._error_box = QMessageBox(
+                QMessageBox.Icon.Warning,
+                "Validation Error",
+                "",
+                QMessageBox.StandardButton.Ok,
+                self,
+            )
+        box.setText(message)
+        box.exec()
 
-    def _current_expiry_iso(self) -> str:
-        qdt = self._expires_edit.dateTime().toUTC()
-        dt = datetime.fromtimestamp(qdt.toSecsSinceEpoch(), tz=timezone.utc).replace(microsecond=0)
-        return dt.isoformat().replace("+00:00", "Z")
+    def _validate_manifest(self, manifest: dict) -> dict:
+        """Validate the form's manifest in memory, without a temporary file."""
+        return validate_manifest_dict(manifest)
 
-    def _current_schedule_iso(self) -> str:
-        qdt = self._schedule_edit.dateTime().toUTC()
-        dt = datetime.fromtimestamp(qdt.toSecsSinceEpoch(), tz=timezone.utc).replace(microsecond=0)
-        return dt.isoformat().replace("+00:00", "Z")
+    @staticmethod
+    def _iso_utc(edit: QDateTimeEdit) -> str:
+        """Return the edit's value as a UTC ISO-8601 string ending in 'Z'."""
+        return edit.dateTime().toUTC().toString(_ISO_Z_FORMAT)
 
     # ------------------------------------------------------------------#
     # Menu actions
     # ------------------------------------------------------------------#
 
+    @Slot()
+    def _show_info_menu(self) -> None:
+        if self._info_button.menu() is not None:
+            return
+        info_menu = QMenu("Info", self)
+        info_menu.addAction("About", self._show_about_dialog)
+        info_menu.addAction("Readme", self._open_readme)
+        # With a menu attached, InstantPopup opens it on later clicks by itself.
+        self._info_button.setMenu(info_menu)
+        self._info_button.showMenu()
+
+    @Slot()
     def _show_about_dialog(self) -> None:
         QMessageBox.information(
             self,
@@ -798,6 +893,7 @@ class ManifestForm(QWidget):
             "Use this tool to author notification modules for the Windows Notifier core app.",
         )
 
+    @Slot()
     def _open_readme(self) -> None:
         readme_path = Path(__file__).resolve().parents[1] / "README.md"
         if readme_path.exists():
@@ -805,8 +901,9 @@ class ManifestForm(QWidget):
         else:
             QMessageBox.information(self, "Readme Not Found", "README.md could not be located.")
 
+    @Slot()
     def _open_intune_dialog(self) -> None:
-        dialog = IntunePackageDialog(self._modules_dir, self)
+        dialog = IntunePackageDialog(self._modules_dir.resolve(), self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             modules = dialog.selected_modules()
             if modules:
@@ -821,8 +918,10 @@ class IntunePackageDialog(QDialog):
         self.setWindowTitle("Create Intune Package")
         self.modules_dir = modules_dir
 
-        self._list = QListWidget()
-        self._list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
+        self._model = _ModuleListModel(self)
+        self._list = QListView()
+        self._list.setModel(self._model)
+        self._list.setSelectionMode(QListView.SelectionMode.MultiSelection)
 
         layout = QVBoxLayout(self)
         description = QLabel("Select one or more modules to include in the Intune package:")
@@ -839,32 +938,22 @@ class IntunePackageDialog(QDialog):
         self._populate_modules()
 
     def _populate_modules(self) -> None:
-        if not self.modules_dir.exists():
-            item = QListWidgetItem(f"Modules directory not found: {self.modules_dir}")
-            item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self._list.addItem(item)
+        module_paths = _list_module_dirs(self.modules_dir)
+        if module_paths is None:
+            self._model.set_placeholder(f"Modules directory not found: {self.modules_dir}")
             self._list.setEnabled(False)
             self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
             return
 
-        module_paths = sorted(
-            [path for path in self.modules_dir.iterdir() if path.is_dir() and (path / "manifest.json").exists()],
-            key=lambda p: p.name.lower(),
-        )
-
         if not module_paths:
-            item = QListWidgetItem("No modules found. Save a module first.")
-            item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self._list.addItem(item)
+            self._model.set_placeholder("No modules found. Save a module first.")
             self._list.setEnabled(False)
             self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
             return
 
-        for path in module_paths:
-            item = QListWidgetItem(path.name)
-            item.setData(Qt.ItemDataRole.UserRole, str(path))
-            self._list.addItem(item)
+        self._model.set_modules(module_paths)
 
+    @Slot()
     def _on_accept(self) -> None:
         if not self.selected_modules():
             QMessageBox.information(self, "No Modules Selected", "Select at least one module to continue.")
@@ -872,9 +961,87 @@ class IntunePackageDialog(QDialog):
         self.accept()
 
     def selected_modules(self) -> list[Path]:
-        modules: list[Path] = []
-        for item in self._list.selectedItems():
-            data = item.data(Qt.ItemDataRole.UserRole)
-            if isinstance(data, str):
-                modules.append(Path(data))
-        return modules
+        rows = sorted(index.row() for index in self._list.selectionModel().selectedIndexes())
+        return [path for path in map(self._model.path_at, rows) if path is not None]
+
+
+class _ModuleListModel(QAbstractListModel):
+    """
+    Module folders for the Intune dialog, held as a plain list of paths.
+
+    When there are no modules a single disabled row shows ``placeholder``.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._paths: list[Path] = []
+        self._placeholder: Optional[str] = None
+
+    def set_modules(self, paths: list[Path]) -> None:
+        self.beginResetModel()
+        self._paths = paths
+        self._placeholder = None
+        self.endResetModel()
+
+    def set_placeholder(self, text: str) -> None:
+        self.beginResetModel()
+        self._paths = []
+        self._placeholder = text
+        self.endResetModel()
+
+    def path_at(self, row: int) -> Optional[Path]:
+        return self._paths[row] if 0 <= row < len(self._paths) else None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._paths:
+            return len(self._paths)
+        return 1 if self._placeholder is not None else 0
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if not self._paths:
+            return self._placeholder if role == Qt.ItemDataRole.DisplayRole else None
+        path = self._paths[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return path.name
+        if role == Qt.ItemDataRole.UserRole:
+            return str(path)
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid() or not self._paths:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+def _list_module_dirs(modules_dir: Path) -> Optional[list[Path]]:
+    """
+    Return the module folders (those holding a manifest.json) sorted by name,
+    or None if ``modules_dir`` does not exist.
+
+    The sorted folder listing is cached by the directory's modification time,
+    which changes whenever a folder is added, removed, or renamed. Writing a
+    manifest inside an existing folder does not change it, so manifest presence
+    is checked on every call.
+    """
+    try:
+        stamp = os.stat(modules_dir).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _MODULES_CACHE.get(modules_dir)
+    if cached is not None and cached[0] == stamp:
+        folders = cached[1]
+    else:
+        try:
+            # DirEntry.is_dir() answers from the directory listing, saving a stat per entry.
+            with os.scandir(modules_dir) as entries:
+                found = [entry for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return None
+        found.sort(key=lambda entry: entry.name.lower())
+        folders = [Path(entry.path) for entry in found]
+        _MODULES_CACHE[modules_dir] = (stamp, folders)
+    return [folder for folder in folders if os.path.exists(os.path.join(folder, "manifest.json"))]
@@ -6,19 +6,52 @@ from __future__ import annotations
 
 import json
 import re
-import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from core.module_id import compute_module_id
-from shared.manifest_schema import load_and_validate_manifest
+from shared.manifest_schema import validate_manifest_dict
 from shared.module_definition import ModuleDefinition
 
+from .file_copy import copy_file
 from .manifest_form import FormData
 
 ASSETS_DIR = Path(__file__).resolve().parent / "Assets"
 IDEA_ICON = ASSETS_DIR / "idea.png"
+# Bundled asset; checked once instead of on every save.
+_IDEA_ICON_AVAILABLE = IDEA_ICON.exists()
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+_MAX_COPY_WORKERS = 3
+
+
+def _copy_assets(copies: list[tuple[Path, Path]]) -> None:
+    """Copy a module's asset files, overlapping the copies when there is more than one."""
+    # Assets are named by their source file name, so media and icon can share a
+    # destination. Keep only the last copy to each one, as copying them in order
+    # would, so no two threads ever write the same file.
+    by_destination = {destination: source for source, destination in copies}
+    if len(by_destination) <= 1:
+        for destination, source in by_destination.items():
+            copy_file(source, destination)
+        return
+    with ThreadPoolExecutor(max_workers=min(_MAX_COPY_WORKERS, len(by_destination))) as executor:
+        # Consume the results so the first copy error is re-raised here.
+        list(executor.map(copy_file, by_destination.values(), by_destination.keys()))
+
+
+def _dump_manifest(manifest: dict[str, Any]) -> bytes:
+    """Serialize a manifest as indented UTF-8 JSON, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest, indent=2).encode("utf-8")
 
 
 @dataclass
@@ -40,23 +73,25 @@ class ModuleWriter:
         manifest = dict(data.manifest)
         target_dir = self._create_unique_folder(manifest["title"])
 
+        # (source, destination) pairs copied together once the manifest validates.
+        copies: list[tuple[Path, Path]] = []
         media_destination = None
         if data.media_file_path:
             media_name = data.media_file_path.name
             media_destination = target_dir / media_name
-            shutil.copy2(data.media_file_path, media_destination)
+            copies.append((data.media_file_path, media_destination))
             manifest["media"] = media_name
 
         if data.icon_preset:
-            if data.icon_preset == "idea" and IDEA_ICON.exists():
+            if data.icon_preset == "idea" and _IDEA_ICON_AVAILABLE:
                 icon_name = "icon_idea.png"
-                shutil.copy2(IDEA_ICON, target_dir / icon_name)
+                copies.append((IDEA_ICON, target_dir / icon_name))
                 manifest["icon"] = icon_name
             else:
                 manifest["icon"] = f"preset:{data.icon_preset}"
         elif data.icon_file_path:
             icon_name = data.icon_file_path.name
-            shutil.copy2(data.icon_file_path, target_dir / icon_name)
+            copies.append((data.icon_file_path, target_dir / icon_name))
             manifest["icon"] = icon_name
 
         if data.sound:
@@ -68,7 +103,7 @@ class ModuleWriter:
             if not data.condition_script_path:
                 raise ValueError("Conditional modules require a PowerShell script.")
             script_name = data.condition_script_path.name
-            shutil.copy2(data.condition_script_path, target_dir / script_name)
+            copies.append((data.condition_script_path, target_dir / script_name))
             manifest["condition_script"] = script_name
             manifest["condition_interval_minutes"] = (
                 data.condition_interval_minutes or manifest.get("condition_interval_minutes") or 60
@@ -77,12 +112,17 @@ class ModuleWriter:
             manifest.pop("condition_script", None)
             manifest.pop("condition_interval_minutes", None)
 
-        manifest_to_write = {key: value for key, value in manifest.items() if value is not None}
+        # ``manifest`` is already a private copy, so drop unset fields in place.
+        for key in [key for key, value in manifest.items() if value is None]:
+            del manifest[key]
+
+        # Validate the dict we are about to write instead of reading it back.
+        normalized = validate_manifest_dict(manifest)
+        _copy_assets(copies)
 
         manifest_path = target_dir / "manifest.json"
-        manifest_path.write_text(json.dumps(manifest_to_write, indent=2), encoding="utf-8")
+        manifest_path.write_bytes(_dump_manifest(manifest))
 
-        normalized = load_and_validate_manifest(manifest_path)
         module = ModuleDefinition(root=target_dir, manifest=normalized)
         if media_destination:
             module.media_path = media_destination
@@ -93,19 +133,22 @@ class ModuleWriter:
 
     def _create_unique_folder(self, title: str) -> Path:
         slug_base = self._slugify(title)
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        timestamp = time.strftime("%Y%m%d%H%M%S", time.gmtime())
         base_name = f"{timestamp}-{slug_base}"
 
         idx = 0
         while True:
             folder_name = base_name if idx == 0 else f"{base_name}-{idx}"
             target = self.modules_dir / folder_name
-            if not target.exists():
+            # mkdir is the existence check, so there is no window for another writer.
+            try:
                 target.mkdir(parents=True)
+            except FileExistsError:
+                idx += 1
+            else:
                 return target
-            idx += 1
 
     @staticmethod
     def _slugify(value: str) -> str:
-        slug = re.sub(r"[^A-Za-z0-9]+", "-", value.strip()).strip("-").lower()
+        slug = _SLUG_RE.sub("-", value.strip()).strip("-").lower()
         return slug or "module"
@@ -7,13 +7,15 @@ from __future__ import annotations
 import ctypes
 import sys
 import time
-from typing import Iterable, Tuple
+from typing import TYPE_CHECKING, Iterable, Tuple
 
-from PySide6.QtWidgets import QApplication
-
-from core.app import AppCoordinator
 from windows_notifier_core.windows_notifier_core import logger as app_logger
 
+# Qt and the coordinator are imported inside the functions below, after the
+# instance guard, so a second launch exits without loading the Qt DLLs.
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
+
 _LOGGER = app_logger.get_logger()
 _MUTEX_NAME = "Global\\WindowsNotifierCoreMutex"
 _ERROR_ALREADY_EXISTS = 183
@@ -50,16 +52,52 @@ class _InstanceGuard:
         self._handle = None
 
 
+def _create_application(argv: Iterable[str]) -> QApplication:
+    """Create the process's QApplication, or return the one already running."""
+    from PySide6.QtCore import QCoreApplication, Qt
+    from PySide6.QtWidgets import QApplication
+
+    from core import icon_cache
+
+    app = QApplication.instance()
+    if app is None:
+        # Required for QtWebEngine, which the media viewer imports lazily after startup.
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+        app = QApplication(list(argv))
+        icon_cache.preload(app)
+    return app
+
+
 def _run_application_once(argv: Iterable[str]) -> Tuple[int, bool]:
     """Start the Qt application once and report whether shutdown was intentional."""
-    app = QApplication(list(argv))
+    from core.app import AppCoordinator
+
+    # Restarts reuse the QApplication so style, font, and plugin setup is paid once;
+    # only the coordinator is rebuilt.
+    app = _create_application(argv)
     coordinator = AppCoordinator()
-    coordinator.start()
-    exit_code = app.exec()
-    manual_shutdown = getattr(coordinator, "manual_shutdown_requested", False)
+    try:
+        coordinator.start()
+        exit_code = app.exec()
+        manual_shutdown = getattr(coordinator, "manual_shutdown_requested", False)
+    finally:
+        coordinator.dispose()
     return exit_code, bool(manual_shutdown)
 
 
+def _wait_before_restart(seconds: int) -> None:
+    """Sleep for ``seconds`` while still pumping Qt and Windows messages."""
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    if QApplication.instance() is None:
+        time.sleep(seconds)
+        return
+    loop = QEventLoop()
+    QTimer.singleShot(seconds * 1000, loop.quit)
+    loop.exec()
+
+
 def main() -> int:
     """Launch the application with single-instance + recovery safeguards."""
     guard = _InstanceGuard(_MUTEX_NAME)
@@ -87,7 +125,7 @@ def main() -> int:
                 exit_code,
                 backoff_seconds,
             )
-            time.sleep(backoff_seconds)
+            _wait_before_restart(backoff_seconds)
             backoff_seconds = min(backoff_seconds * 2, max_backoff)
     finally:
         guard.release()
@@ -28,10 +28,11 @@ def configure(log_path: Optional[Path] = None) -> None:
     target = log_path or DEFAULT_LOG_PATH
     target.parent.mkdir(parents=True, exist_ok=True)
 
-    # Keep console output and add a persistent file sink.
+    # Keep console output and add a persistent file sink. The console is written
+    # synchronously; only the rotating file sink goes through loguru's queue.
     _logger.remove()
     if sys.stderr is not None:
-        _logger.add(sys.stderr, level="INFO", enqueue=True)
+        _logger.add(sys.stderr, level="INFO", enqueue=False)
     _logger.add(
         target,
         level="DEBUG",